@@ -0,0 +1,52 @@
+"""Benchmark the runtime of the pandas backend against the numpy backend.
+
+Run with ``python -m benchmarks.bench_backends`` from the root of the repository.
+
+"""
+import timeit
+
+import yaml
+
+from benchmarks.bench_input_memory import create_data
+from dag_gettsim.dag import compile_dag
+from gettsim.config import ROOT_DIR
+from gettsim.pre_processing.policy_for_date import get_policies_for_date
+
+N_ROWS = [1_000_000, 10_000_000]
+N_REPEATS = 3
+YEAR = 2018
+TARGETS = [
+    "sozialv_beitr_m",
+    "rentenv_beitr_m",
+    "arbeitsl_v_beitr_m",
+    "ges_krankv_beitr_m",
+    "pflegev_beitr_m",
+]
+
+
+def main():
+    raw_data = yaml.safe_load(
+        (ROOT_DIR / "soz_vers_beitr.yaml").read_text(encoding="utf-8")
+    )
+    params = get_policies_for_date(
+        year=YEAR, group="soz_vers_beitr", raw_group_data=raw_data
+    )
+    plan = compile_dag(targets=TARGETS)
+
+    print(f"{'rows':>10} {'pandas':>10} {'numpy':>10} {'speedup':>8}")
+    for n_rows in N_ROWS:
+        data = create_data(n_rows)
+        timings = {}
+        for backend in ["pandas", "numpy"]:
+            timer = timeit.Timer(lambda: plan.run(data, params, backend=backend))
+            timings[backend] = min(timer.repeat(repeat=N_REPEATS, number=1))
+
+        print(
+            f"{n_rows:>10} {timings['pandas']:9.3f}s {timings['numpy']:9.3f}s "
+            f"{timings['pandas'] / timings['numpy']:7.2f}x"
+        )
+        del data
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark building and pruning the DAG for synthetic function sets.
+
+Run with ``python -m benchmarks.bench_dag_construction`` from the root of the
+repository.
+
+"""
+import random
+import timeit
+
+import networkx as nx
+
+from dag_gettsim.dag import create_dag
+from dag_gettsim.dag import prune_dag
+
+N_NODES = [100, 1_000, 10_000]
+N_ARGUMENTS = 3
+N_LEAVES = 20
+
+
+def create_synthetic_functions(n_nodes, seed=0):
+    """Create functions where each function depends on a few earlier nodes.
+
+    Args:
+        n_nodes (int): Number of functions.
+        seed (int): Seed of the random number generator.
+
+    Returns:
+        dict: Dictionary mapping function names to functions.
+
+    """
+    rng = random.Random(seed)
+    available = [f"leaf_{i}" for i in range(N_LEAVES)]
+    source = []
+    for i in range(n_nodes):
+        args = rng.sample(available, min(N_ARGUMENTS, len(available)))
+        source.append(f"def node_{i}({', '.join(args)}, params):\n    pass\n")
+        available.append(f"node_{i}")
+
+    namespace = {}
+    exec("\n".join(source), namespace)  # noqa: S102
+
+    return {f"node_{i}": namespace[f"node_{i}"] for i in range(n_nodes)}
+
+
+def prune_dag_fixpoint(dag, targets):
+    """The previous implementation which is kept as a reference."""
+    visited_nodes = set(targets)
+    visited_nodes_changed = True
+    while visited_nodes_changed:
+        n_visited_nodes = len(visited_nodes)
+        for node in visited_nodes:
+            visited_nodes = visited_nodes.union(nx.ancestors(dag, node))
+
+        visited_nodes_changed = n_visited_nodes != len(visited_nodes)
+
+    dag.remove_nodes_from(set(dag.nodes) - visited_nodes)
+
+    return dag
+
+
+def _time_prune(prune, functions, targets, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        dag = create_dag(functions)
+        start = timeit.default_timer()
+        prune(dag, targets)
+        timings.append(timeit.default_timer() - start)
+
+    return min(timings)
+
+
+def main():
+    print(f"{'nodes':>8} {'build':>10} {'prune':>10} {'prune (fix-point)':>18}")
+    for n_nodes in N_NODES:
+        functions = create_synthetic_functions(n_nodes)
+        targets = [f"node_{i}" for i in range(n_nodes - 5, n_nodes)]
+
+        build = min(timeit.repeat(lambda: create_dag(functions), number=1, repeat=5))
+        prune = _time_prune(prune_dag, functions, targets)
+        fixpoint = _time_prune(prune_dag_fixpoint, functions, targets)
+
+        print(
+            f"{n_nodes:>8} {build * 1_000:7.2f} ms {prune * 1_000:7.2f} ms "
+            f"{fixpoint * 1_000:15.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark loading a wide Parquet file completely against loading only the columns
+which are required by the pruned DAG.
+
+Run with ``python -m benchmarks.bench_data_loader`` from the root of the repository.
+
+"""
+import tempfile
+import timeit
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_input_memory import create_data
+from dag_gettsim.data_loader import load_data
+
+N_ROWS = 200_000
+N_COLUMNS = 400
+TARGETS = ["sozialv_beitr_m", "pflegev_beitr_m"]
+
+
+def create_wide_file(path, n_rows, n_columns, seed=0):
+    """Create a Parquet file with the input columns and many other columns."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(create_data(n_rows))
+    n_other = n_columns - df.shape[1]
+    other = pd.DataFrame(
+        rng.normal(size=(n_rows, n_other)), columns=[f"var_{i}" for i in range(n_other)]
+    )
+    pd.concat([df, other], axis=1).to_parquet(path, row_group_size=50_000)
+
+
+def _size(data):
+    return sum(column.memory_usage(deep=True) for column in data.values()) / 1024 ** 2
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "wide.parquet"
+        create_wide_file(path, N_ROWS, N_COLUMNS)
+
+        def full():
+            return dict(pd.read_parquet(path))
+
+        def projected():
+            return load_data(path, targets=TARGETS)
+
+        def projected_year():
+            return load_data(path, targets=TARGETS, years=2018)
+
+        print(f"{N_ROWS:,} rows and {N_COLUMNS} columns")
+        print(f"{'':>22} {'time':>10} {'memory':>12}")
+        for name, func in [
+            ("all columns", full),
+            ("required columns", projected),
+            ("required, jahr=2018", projected_year),
+        ]:
+            time = min(timeit.repeat(func, number=1, repeat=3))
+            print(f"{name:>22} {time * 1_000:7.1f} ms {_size(func()):9.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark the peak resident memory with and without garbage collection.
+
+Every measurement runs in a fresh process so that the peak resident set size of one
+measurement does not leak into the next one. The high-water mark of the resident set
+size is reset after the data is created which requires Linux.
+
+Run with ``python -m benchmarks.bench_garbage_collection`` from the root of the
+repository.
+
+"""
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+import yaml
+
+from benchmarks.bench_input_memory import create_data
+from dag_gettsim.dag import compile_dag
+from gettsim.config import ROOT_DIR
+from gettsim.pre_processing.policy_for_date import get_policies_for_date
+
+N_ROWS = 2_000_000
+YEAR = 2018
+TARGETS = {
+    "sozialv_beitr_m": ["sozialv_beitr_m"],
+    "pflegev_beitr_m": ["pflegev_beitr_m"],
+    "all": "all",
+}
+
+
+def _read_rss():
+    """Read the current and the peak resident set size in MB."""
+    status = Path("/proc/self/status").read_text().splitlines()
+    values = dict(line.split(":", 1) for line in status)
+    current, peak = (int(values[key].split()[0]) / 1024 for key in ["VmRSS", "VmHWM"])
+    return current, peak
+
+
+def _peak_rss_increase(targets, collect_garbage):
+    raw_data = yaml.safe_load(
+        (ROOT_DIR / "soz_vers_beitr.yaml").read_text(encoding="utf-8")
+    )
+    params = get_policies_for_date(
+        year=YEAR, group="soz_vers_beitr", raw_group_data=raw_data
+    )
+    data = create_data(N_ROWS)
+    plan = compile_dag(targets=targets)
+    if not collect_garbage:
+        plan.garbage = {}
+
+    Path("/proc/self/clear_refs").write_text("5")
+    before, _ = _read_rss()
+    plan.run(data, params)
+    _, after = _read_rss()
+
+    return after - before
+
+
+def peak_rss_increase(targets, collect_garbage):
+    """Measure the increase of the peak RSS in MB while running the plan."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        future = executor.submit(_peak_rss_increase, targets, collect_garbage)
+        return future.result()
+
+
+def main():
+    print(f"Peak RSS increase for {N_ROWS:,} rows")
+    print(f"{'targets':>16} {'without gc':>12} {'with gc':>12}")
+    for name, targets in TARGETS.items():
+        without = peak_rss_increase(targets, collect_garbage=False)
+        with_ = peak_rss_increase(targets, collect_garbage=True)
+        print(f"{name:>16} {without:9.1f} MB {with_:9.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark the peak memory of copying the input data against read-only views.
+
+Run with ``python -m benchmarks.bench_input_memory`` from the root of the repository.
+
+"""
+import copy
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from dag_gettsim.dag import compute_taxes_and_transfers
+from gettsim.config import ROOT_DIR
+from gettsim.pre_processing.policy_for_date import get_policies_for_date
+
+N_ROWS = [100_000, 1_000_000, 5_000_000]
+YEAR = 2018
+TARGETS = ["sozialv_beitr_m"]
+INPUT_COLS = [
+    "p_id",
+    "hh_id",
+    "tu_id",
+    "bruttolohn_m",
+    "wohnort_ost",
+    "alter",
+    "selbstständig",
+    "hat_kinder",
+    "eink_selbst_m",
+    "ges_rente_m",
+    "prv_krankv",
+    "jahr",
+]
+
+
+def create_data(n_rows):
+    """Repeat the rows of the test data until the dataset has ``n_rows`` rows."""
+    test_data = pd.read_csv(ROOT_DIR / "../dag_gettsim/tests/test_dfs_ssc.csv")
+    positions = np.arange(n_rows) % len(test_data)
+    df = test_data[INPUT_COLS].iloc[positions].reset_index(drop=True)
+    return dict(df)
+
+
+def peak_memory(func, *args, **kwargs):
+    """Return the peak memory in MB allocated while ``func`` is running."""
+    tracemalloc.start()
+    func(*args, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 ** 2
+
+
+def _with_deepcopy(data, **kwargs):
+    return compute_taxes_and_transfers(copy.deepcopy(data), **kwargs)
+
+
+def main():
+    raw_data = yaml.safe_load(
+        (ROOT_DIR / "soz_vers_beitr.yaml").read_text(encoding="utf-8")
+    )
+    params = get_policies_for_date(
+        year=YEAR, group="soz_vers_beitr", raw_group_data=raw_data
+    )
+
+    print(f"{'rows':>10} {'input':>10} {'deepcopy':>12} {'read-only':>12}")
+    for n_rows in N_ROWS:
+        data = create_data(n_rows)
+        size = sum(column.memory_usage(deep=True) for column in data.values())
+        kwargs = {"params": params, "targets": TARGETS}
+
+        copied = peak_memory(_with_deepcopy, data, **kwargs)
+        read_only = peak_memory(compute_taxes_and_transfers, data, **kwargs)
+
+        print(
+            f"{n_rows:>10} {size / 1024 ** 2:7.1f} MB {copied:9.1f} MB "
+            f"{read_only:9.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,34 @@
-import copy
 import inspect
+from functools import lru_cache
 from functools import partial
 from pathlib import Path
 
 import networkx as nx
+import numpy as np
+import pandas as pd
 
 from dag_gettsim.functions_loader import load_functions
+from dag_gettsim.schedulers import SCHEDULERS
+
+
+INTERNAL_FUNCTION_FILES = [
+    "arbeitsl_v_rentenv.py",
+    "krankv_pflegev.py",
+    "eink_grenzen.py",
+]
+
+BACKENDS = ("pandas", "numpy")
 
 
 def compute_taxes_and_transfers(
-    data, functions=None, params=None, targets="all", return_dag=False
+    data,
+    functions=None,
+    params=None,
+    targets="all",
+    return_dag=False,
+    scheduler="serial",
+    n_workers=None,
+    backend="pandas",
 ):
     """Simulate a tax and transfers system specified in model_spec.
 
@@ -25,74 +44,217 @@ def compute_taxes_and_transfers(
             an existing parameter from the gettsim parameters database at the
             specified date they override that parameter.
         targets (list): List of strings with names of functions whose output is actually
-            needed by the user. By default, all results are returned.
+            needed by the user. By default, the results of all functions are returned.
+        return_dag (bool): Whether to return the DAG along with the results.
+        scheduler (str): One of ``"serial"``, ``"threads"`` or ``"processes"``. See
+            :func:`execute_dag`.
+        n_workers (int): Number of workers for parallel schedulers. Defaults to the
+            number of CPUs.
+        backend (str): Either ``"pandas"`` or ``"numpy"``. See
+            :meth:`ExecutionPlan.run`.
 
     Returns:
         dict: Dictionary of Series containing the target quantities.
 
     """
-    data = copy.deepcopy(data)
+    plan = compile_dag(functions, targets)
+    results = plan.run(
+        data, params, scheduler=scheduler, n_workers=n_workers, backend=backend
+    )
+
+    if return_dag:
+        results = (results, plan.dag)
+
+    return results
+
+
+def compile_dag(functions=None, targets="all"):
+    """Compile the functions and targets into a reusable execution plan.
+
+    All work which does not depend on the data or the parameters is done once here:
+    loading the functions, inspecting their signatures, building and pruning the DAG,
+    sorting it topologically and scheduling the garbage collection. Repeated
+    simulations with the same functions and targets only need to call
+    :meth:`ExecutionPlan.run`.
+
+    Args:
+        functions (dict): Dictionary with user provided functions. See
+            :func:`compute_taxes_and_transfers`.
+        targets (list): List of strings with names of functions whose output is actually
+            needed by the user. By default, all results are returned.
 
+    Returns:
+        ExecutionPlan: The compiled plan.
+
+    """
     if isinstance(targets, str) and targets != "all":
         targets = [targets]
 
     user_functions = [] if functions is None else functions
     user_functions = load_functions(user_functions)
 
-    internal_functions = {}
-    internal_function_files = [
-        "arbeitsl_v_rentenv.py",
-        "krankv_pflegev.py",
-        "eink_grenzen.py",
-    ]
-    for file in internal_function_files:
-        new_funcs = load_functions(Path(__file__).parent / "soz_vers_funcs" / file)
-        internal_functions.update(new_funcs)
+    internal_functions = load_internal_functions()
 
-    func_dict = create_function_dict(user_functions, internal_functions, params)
+    func_dict = {**internal_functions, **user_functions}
 
     dag = create_dag(func_dict)
 
     if targets != "all":
         dag = prune_dag(dag, targets)
 
+    return ExecutionPlan(func_dict, dag, targets)
+
+
+class ExecutionPlan:
+    """A compiled DAG which can be executed on many datasets and parameters.
+
+    Args:
+        func_dict (dict): Maps function names to functions.
+        dag (nx.DiGraph): The (pruned) DAG.
+        targets (list or str): Variables of interest or "all".
+
+    Attributes:
+        dag (nx.DiGraph): The (pruned) DAG.
+        targets (list or str): Variables of interest or "all".
+        order (tuple): Nodes of the DAG in topological order.
+        arguments (dict): Maps each node to a tuple of its data dependencies.
+        uses_params (frozenset): Names of functions which receive the parameters.
+        outputs (frozenset): Nodes which are returned. These are the targets or all
+            functions in the DAG if ``targets="all"``.
+        last_consumers (dict): Maps each node to the last node in :attr:`order` which
+            uses it.
+        garbage (dict): Maps each node to a tuple of nodes which are no longer
+            necessary once the node is evaluated.
+        relevant_columns (frozenset): Nodes of the DAG which can be supplied by the
+            data.
+        input_columns (tuple): Nodes of the DAG which are not computed by a function
+            and must be supplied by the data.
+
+    """
+
+    def __init__(self, func_dict, dag, targets):
+        self.dag = dag
+        self.targets = targets
+        self.func_dict = {name: func_dict[name] for name in dag if name in func_dict}
+        self.order = tuple(nx.topological_sort(dag))
+        self.arguments = {node: tuple(dag.predecessors(node)) for node in self.order}
+        self.uses_params = frozenset(
+            name
+            for name, func in self.func_dict.items()
+            if "params" in inspect.getfullargspec(func).args
+        )
+        self.outputs = _resolve_outputs(self.func_dict, targets)
+        self.last_consumers = create_last_consumers(dag, self.order)
+        self.garbage = create_garbage_schedule(self.last_consumers, self.outputs)
+        self.relevant_columns = frozenset(dag.nodes)
+        self.input_columns = tuple(
+            node for node in self.order if node not in self.func_dict
+        )
+
+    def run(
+        self,
+        data,
+        params=None,
+        scheduler="serial",
+        n_workers=None,
+        squeeze=True,
+        backend="pandas",
+    ):
+        """Execute the plan.
+
+        The data is not copied. Instead, the functions receive read-only views on the
+        columns. If a function tries to modify one of its arguments in-place, it is
+        evaluated again on private copies of the read-only arguments. Thus, the data of
+        the caller is never changed.
+
+        All columns have the same length and are aligned by position. With the
+        ``"pandas"`` backend, the functions receive and return Series which share the
+        index of the data. With the ``"numpy"`` backend, the functions receive and
+        return plain arrays which avoids the overhead of index alignment in pandas.
+        The results are only converted to Series with the index of the data once all
+        functions are evaluated.
+
+        Args:
+            data (dict): User provided dataset as dictionary of Series.
+            params (dict): Dictionary with parameters passed to all functions which
+                have an argument called ``params``.
+            scheduler (str): One of ``"serial"``, ``"threads"`` or ``"processes"``.
+                See :func:`execute_dag`.
+            n_workers (int): Number of workers for parallel schedulers. Defaults to the
+                number of CPUs.
+            squeeze (bool): Whether to return the Series instead of a dictionary if
+                there is only one target.
+            backend (str): Either ``"pandas"`` or ``"numpy"``. Determines whether the
+                columns are passed between functions as Series or as arrays.
+
+        Returns:
+            dict or pd.Series: Dictionary of Series containing the target quantities or
+                the Series if there is only one target.
+
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}'. Choose one of {BACKENDS}.")
+
         # Remove columns in data which are not used in the DAG.
-        relevant_columns = set(data) & set(dag.nodes)
-        data = _dict_subset(data, relevant_columns)
+        data = _dict_subset(data, self.relevant_columns & set(data))
+        index = _get_index(data)
+
+        if backend == "numpy":
+            data = {name: np.asarray(column) for name, column in data.items()}
+        data = {name: _read_only_view(column) for name, column in data.items()}
+
+        func_dict = {
+            name: _BackendFunction(
+                partial(func, params=params) if name in self.uses_params else func,
+                name,
+                index if backend == "pandas" else None,
+            )
+            for name, func in self.func_dict.items()
+        }
+
+        results = execute_dag(
+            func_dict,
+            self.dag,
+            data,
+            self.targets,
+            plan=self,
+            scheduler=scheduler,
+            n_workers=n_workers,
+        )
 
-    results = execute_dag(func_dict, dag, data, targets)
+        if backend == "numpy":
+            results = {
+                name: _to_series(column, name, index)
+                for name, column in results.items()
+            }
 
-    if len(results) == 1:
-        results = list(results.values())[0]
+        if squeeze and len(results) == 1:
+            results = list(results.values())[0]
 
-    if return_dag:
-        results = (results, dag)
+        return results
 
-    return results
 
+@lru_cache(maxsize=None)
+def _load_internal_functions():
+    internal_functions = {}
+    for file in INTERNAL_FUNCTION_FILES:
+        new_funcs = load_functions(Path(__file__).parent / "soz_vers_funcs" / file)
+        internal_functions.update(new_funcs)
 
-def create_function_dict(user_functions, internal_functions, params):
-    """Create a dictionary of all functions that will appear in the DAG.
+    return internal_functions
 
-    Args:
-        user_functions (dict): Dictionary with user provided functions. The keys are the
-            names of the function. The values are either callables or strings with
-            absolute or relative import paths to a function.
+
+def load_internal_functions():
+    """Load the internal functions of gettsim.
+
+    The modules are only executed on the first call, later calls return the cached
+    functions.
 
     Returns:
         dict: Dictionary mapping function names to callables.
 
     """
-    functions = {**internal_functions, **user_functions}
-
-    partialed = {
-        name: partial(func, params=params)
-        if "params" in inspect.getfullargspec(func).args
-        else func
-        for name, func in functions.items()
-    }
-
-    return partialed
+    return dict(_load_internal_functions())
 
 
 def create_dag(func_dict):
@@ -102,19 +264,28 @@ def create_dag(func_dict):
         func_dict (dict): Maps function names to functions.
 
     Returns:
-        dict: The DAG, represented as a dictionary of lists that maps function names
-            to a list of its data dependencies.
+        nx.DiGraph: The DAG where edges point from data dependencies to the functions
+            which use them.
 
     """
-    dag_dict = {
-        name: inspect.getfullargspec(func).args for name, func in func_dict.items()
-    }
-    return nx.DiGraph(dag_dict).reverse()
+    dag = nx.DiGraph()
+    dag.add_nodes_from(func_dict)
+    dag.add_edges_from(
+        (arg, name)
+        for name, func in func_dict.items()
+        for arg in inspect.getfullargspec(func).args
+        if arg != "params"
+    )
+    return dag
 
 
 def prune_dag(dag, targets):
     """Prune the dag.
 
+    The DAG is traversed once from the targets to the bottom. To keep the traversal
+    cheap for large graphs, the nodes are mapped to integers and the predecessors are
+    stored as tuples of integers.
+
     Args:
         dag (nx.DiGraph): The unpruned DAG.
         targets (list): Variables of interest.
@@ -123,27 +294,35 @@ def prune_dag(dag, targets):
         dag (nx.DiGraph): Pruned DAG.
 
     """
-    # Go through the DAG from the targets to the bottom and collect all visited nodes.
-    visited_nodes = set(targets)
-    visited_nodes_changed = True
-    while visited_nodes_changed:
-        n_visited_nodes = len(visited_nodes)
-        for node in visited_nodes:
-            visited_nodes = visited_nodes.union(nx.ancestors(dag, node))
+    nodes = list(dag)
+    index = {node: i for i, node in enumerate(nodes)}
+    predecessors = [tuple(index[pred] for pred in dag.pred[node]) for node in nodes]
+
+    missing = [target for target in targets if target not in index]
+    if missing:
+        raise KeyError(f"Missing variable or function: {', '.join(missing)}")
 
-        visited_nodes_changed = n_visited_nodes != len(visited_nodes)
+    # Go through the DAG from the targets to the bottom and collect all visited nodes.
+    visited = bytearray(len(nodes))
+    stack = [index[target] for target in targets]
+    while stack:
+        node = stack.pop()
+        if not visited[node]:
+            visited[node] = 1
+            stack.extend(pred for pred in predecessors[node] if not visited[pred])
 
     # Redundant nodes are nodes not visited going from the targets through the graph.
-    all_nodes = set(dag.nodes)
-    redundant_nodes = all_nodes - visited_nodes
+    redundant_nodes = [node for node, seen in zip(nodes, visited) if not seen]
 
     dag.remove_nodes_from(redundant_nodes)
 
     return dag
 
 
-def execute_dag(func_dict, dag, data, targets):
-    """Naive serial scheduler for our tasks.
+def execute_dag(
+    func_dict, dag, data, targets, plan=None, scheduler="serial", n_workers=None
+):
+    """Execute the DAG with one of our own schedulers.
 
     We will probably use some existing scheduler instead. Interesting sources are:
     - https://ipython.org/ipython-doc/3/parallel/dag_dependencies.html
@@ -152,32 +331,44 @@ def execute_dag(func_dict, dag, data, targets):
     The main reason for writing an own implementation is to explore how difficult it
     would to avoid dask as a dependency.
 
+    The ``"serial"`` scheduler evaluates one task after another in topological order.
+    The ``"threads"`` scheduler evaluates every task as soon as its dependencies are
+    available in a pool of threads. The ``"processes"`` scheduler does the same in a
+    pool of forked processes which exchange the data via shared memory. All schedulers
+    produce the same results.
+
     Args:
         func_dict (dict): Maps function names to functions.
         dag (nx.DiGraph)
         data (dict):
         targets (list):
+        plan (ExecutionPlan): A compiled plan for the DAG. If given, the topological
+            order and the garbage collection schedule are taken from the plan instead
+            of being computed from the DAG.
+        scheduler (str): One of ``"serial"``, ``"threads"`` or ``"processes"``.
+        n_workers (int): Number of workers for parallel schedulers. Defaults to the
+            number of CPUs.
 
     Returns:
         dict: Dictionary of pd.Series with the results.
 
     """
-    # Needed for garbage collection.
-    visited_nodes = set(data)
-    results = data.copy()
-
-    for task in nx.topological_sort(dag):
-        if task not in results:
-            if task in func_dict:
-                kwargs = _dict_subset(results, dag.predecessors(task))
-                results[task] = func_dict[task](**kwargs)
-            else:
-                raise KeyError(f"Missing variable or function: {task}")
+    if scheduler not in SCHEDULERS:
+        raise ValueError(
+            f"Unknown scheduler '{scheduler}'. Choose one of {list(SCHEDULERS)}."
+        )
 
-            visited_nodes.add(task)
+    if plan is None:
+        order = tuple(nx.topological_sort(dag))
+        arguments = {node: tuple(dag.predecessors(node)) for node in order}
+        outputs = _resolve_outputs(func_dict, targets)
+        garbage = create_garbage_schedule(create_last_consumers(dag, order), outputs)
+    else:
+        order, arguments, garbage = plan.order, plan.arguments, plan.garbage
 
-            if targets != "all":
-                results = collect_garbage(results, task, visited_nodes, targets, dag)
+    results = SCHEDULERS[scheduler](
+        func_dict, order, arguments, garbage, data.copy(), n_workers
+    )
 
     return results
 
@@ -186,28 +377,128 @@ def _dict_subset(dictionary, keys):
     return {k: dictionary[k] for k in keys}
 
 
-def collect_garbage(results, task, visited_nodes, targets, dag):
-    """Remove data which is no longer necessary.
+def _read_only_view(column):
+    """Create a view on a column which raises an error if it is modified in-place.
+
+    Columns which are not backed by a NumPy array, e.g., extension arrays, cannot be
+    protected and are copied instead.
+
+    Args:
+        column (pd.Series or np.ndarray): A column of the data.
+
+    Returns:
+        pd.Series or np.ndarray: A read-only view on the column.
+
+    """
+    if isinstance(column, pd.Series):
+        values = column.values
+        if isinstance(values, np.ndarray):
+            view = values.view()
+            view.flags.writeable = False
+            out = pd.Series(view, index=column.index, name=column.name, copy=False)
+        else:
+            out = column.copy()
+    elif isinstance(column, np.ndarray):
+        out = column.view()
+        out.flags.writeable = False
+    else:
+        out = column
+
+    return out
+
+
+def _get_index(data):
+    """Get the index of the first Series in the data or a default range index."""
+    for column in data.values():
+        if isinstance(column, pd.Series):
+            return column.index
+
+    n_rows = len(next(iter(data.values()))) if data else 0
+    return pd.RangeIndex(n_rows)
+
+
+def _to_series(column, name, index):
+    """Convert the output of a function to a Series with the index of the data.
+
+    Scalars are broadcast to all rows.
+
+    """
+    if isinstance(column, pd.Series):
+        return column.rename(name, copy=False)
+
+    return pd.Series(
+        np.broadcast_to(column, len(index)), index=index, name=name, copy=False
+    )
+
+
+class _BackendFunction:
+    """Convert the output of a function to the column type of the backend.
+
+    With an index, the output becomes a Series with this index. Without an index, the
+    output becomes an array.
+
+    """
+
+    def __init__(self, func, name, index=None):
+        self.func = func
+        self.name = name
+        self.index = index
+
+    def __call__(self, **kwargs):
+        out = self.func(**kwargs)
+        if self.index is None:
+            out = np.asarray(out)
+        else:
+            out = _to_series(out, self.name, self.index)
+
+        return out
+
+
+def _resolve_outputs(func_dict, targets):
+    return frozenset(func_dict) if targets == "all" else frozenset(targets)
+
 
-    If all descendants of a node have been evaluated, the information in the node
-    becomes redundant and can be removed to save memory.
+def create_last_consumers(dag, order):
+    """Find the last node which uses the result of each node.
 
     Args:
-        results (dict)
-        task (str)
-        visited_nodes (set)
         dag (nx.DiGraph)
+        order (tuple): Nodes of the DAG in topological order.
 
     Returns:
-        results (dict)
+        last_consumers (dict): Maps each node with successors to the successor which
+            comes last in ``order``.
 
     """
-    for ancestor in dag.predecessors(task):
-        is_obsolete = all(
-            successor in visited_nodes for successor in dag.successors(ancestor)
-        )
+    position = {node: i for i, node in enumerate(order)}
 
-        if is_obsolete and ancestor not in targets:
-            del results[ancestor]
+    return {
+        node: max(dag.successors(node), key=position.__getitem__)
+        for node in order
+        if dag.out_degree(node)
+    }
 
-    return results
+
+def create_garbage_schedule(last_consumers, outputs):
+    """Schedule the removal of data which is no longer necessary.
+
+    Once the last consumer of a node has been evaluated, the information in the node
+    becomes redundant and can be removed to save memory. Inverting the table of last
+    consumers yields for every node the results which can be released right after it
+    is evaluated.
+
+    Args:
+        last_consumers (dict): Maps each node to the last node which uses it.
+        outputs (frozenset): Variables of interest which are never removed.
+
+    Returns:
+        garbage (dict): Maps each node to a tuple of nodes which can be removed after
+            the node is evaluated.
+
+    """
+    garbage = {}
+    for node, consumer in last_consumers.items():
+        if node not in outputs:
+            garbage.setdefault(consumer, []).append(node)
+
+    return {node: tuple(obsolete) for node, obsolete in garbage.items()}
@@ -0,0 +1,136 @@
+"""Load the data for a DAG from Parquet or Arrow IPC (Feather) files.
+
+The pruned DAG determines which input columns are needed to compute the targets. Only
+these columns are read from the file which is much faster and requires much less memory
+than loading wide survey files completely. Optionally, only rows of certain years are
+read. For Parquet files, row groups whose statistics show that they do not contain any
+of the years are skipped.
+
+"""
+from pathlib import Path
+
+import pandas as pd
+
+from dag_gettsim.dag import compile_dag
+
+try:
+    import pyarrow.dataset as ds
+except ImportError:
+    IS_PYARROW_INSTALLED = False
+else:
+    IS_PYARROW_INSTALLED = True
+
+
+FILE_FORMATS = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "ipc",
+    ".arrow": "ipc",
+    ".ipc": "ipc",
+}
+
+
+def load_data(path, targets="all", functions=None, years=None, columns=None):
+    """Load the input columns which are needed to compute the targets.
+
+    Args:
+        path (str or pathlib.Path): Path to a Parquet or Arrow IPC (Feather) file.
+        targets (list): List of strings with names of functions whose output is actually
+            needed by the user. By default, the inputs of all functions are loaded.
+        functions (dict): Dictionary with user provided functions. See
+            :func:`~dag_gettsim.dag.compute_taxes_and_transfers`.
+        years (int or list): Only load rows where ``jahr`` is one of the years.
+        columns (list): Additional columns which are loaded, e.g., identifiers.
+
+    Returns:
+        dict: Dictionary of Series which can be passed to
+            :func:`~dag_gettsim.dag.compute_taxes_and_transfers`.
+
+    """
+    dataset, columns, filter_ = _prepare_scan(path, targets, functions, years, columns)
+    table = dataset.to_table(columns=columns, filter=filter_)
+
+    return _table_to_dict(table)
+
+
+def iter_data_chunks(
+    path, targets="all", functions=None, years=None, columns=None, chunk_size=None
+):
+    """Load the input columns which are needed to compute the targets in chunks.
+
+    The chunks can be passed to
+    :func:`~dag_gettsim.streaming.compute_taxes_and_transfers_in_chunks` to process
+    files which do not fit into memory.
+
+    Args:
+        path (str or pathlib.Path): Path to a Parquet or Arrow IPC (Feather) file.
+        targets (list): List of strings with names of functions whose output is actually
+            needed by the user. By default, the inputs of all functions are loaded.
+        functions (dict): Dictionary with user provided functions.
+        years (int or list): Only load rows where ``jahr`` is one of the years.
+        columns (list): Additional columns which are loaded, e.g., identifiers.
+        chunk_size (int): Maximum number of rows per chunk. Defaults to the batch size
+            of pyarrow.
+
+    Yields:
+        dict: Dictionary of Series holding a chunk of rows. The index of the Series is
+            the position of the rows in the filtered file.
+
+    """
+    dataset, columns, filter_ = _prepare_scan(path, targets, functions, years, columns)
+    kwargs = {} if chunk_size is None else {"batch_size": chunk_size}
+
+    start = 0
+    for batch in dataset.to_batches(columns=columns, filter=filter_, **kwargs):
+        if batch.num_rows:
+            chunk = _table_to_dict(batch, start)
+            start += batch.num_rows
+            yield chunk
+
+
+def get_required_columns(targets="all", functions=None):
+    """Get the input columns which are needed to compute the targets.
+
+    Args:
+        targets (list): List of strings with names of functions whose output is actually
+            needed by the user.
+        functions (dict): Dictionary with user provided functions.
+
+    Returns:
+        list: Names of the input columns.
+
+    """
+    return list(compile_dag(functions, targets).input_columns)
+
+
+def _prepare_scan(path, targets, functions, years, columns):
+    if not IS_PYARROW_INSTALLED:
+        raise ImportError("Loading Parquet or Arrow files requires pyarrow.")
+
+    path = Path(path)
+    if path.suffix not in FILE_FORMATS:
+        raise ValueError(
+            f"Unknown file format '{path.suffix}'. Use one of {list(FILE_FORMATS)}."
+        )
+    dataset = ds.dataset(path, format=FILE_FORMATS[path.suffix])
+
+    required = get_required_columns(targets, functions)
+    missing = [column for column in required if column not in dataset.schema.names]
+    if missing:
+        raise KeyError(f"Missing variable or function: {', '.join(missing)}")
+
+    columns = required + [column for column in columns or [] if column not in required]
+
+    if years is None:
+        filter_ = None
+    else:
+        years = [years] if isinstance(years, int) else list(years)
+        filter_ = ds.field("jahr").isin(years)
+
+    return dataset, columns, filter_
+
+
+def _table_to_dict(table, start=0):
+    df = table.to_pandas()
+    df.index = pd.RangeIndex(start, start + len(df))
+    return dict(df)
@@ -0,0 +1,324 @@
+"""Schedulers which evaluate the functions of a compiled DAG.
+
+All schedulers share the same interface. They receive the functions, the nodes in
+topological order, the data dependencies of each node, the garbage collection schedule
+and the dictionary of results which initially holds the data. They return the
+dictionary of results.
+
+"""
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+
+import numpy as np
+import pandas as pd
+
+from dag_gettsim.shared_columns import attach_column
+from dag_gettsim.shared_columns import close_blocks
+from dag_gettsim.shared_columns import read_column
+from dag_gettsim.shared_columns import share_column
+from dag_gettsim.shared_columns import unlink_column
+
+
+def execute_serial(func_dict, order, arguments, garbage, results, n_workers=None):
+    """Evaluate the tasks one after another in topological order.
+
+    Args:
+        func_dict (dict): Maps function names to functions.
+        order (tuple): Nodes of the DAG in topological order.
+        arguments (dict): Maps each node to a tuple of its data dependencies.
+        garbage (dict): Maps each node to a tuple of nodes which can be removed after
+            the node is evaluated.
+        results (dict): Dictionary with the data.
+        n_workers (int): Ignored.
+
+    Returns:
+        dict: Dictionary of pd.Series with the results.
+
+    """
+    for task in order:
+        if task not in results:
+            if task in func_dict:
+                kwargs = _dict_subset(results, arguments[task])
+                results[task] = evaluate_task(func_dict[task], kwargs)
+            else:
+                raise KeyError(f"Missing variable or function: {task}")
+
+        for node in garbage.get(task, ()):
+            results.pop(node, None)
+
+    return results
+
+
+def execute_threads(func_dict, order, arguments, garbage, results, n_workers=None):
+    """Evaluate the tasks in a pool of threads.
+
+    A task is submitted as soon as all of its data dependencies are available. Thus,
+    independent branches of the DAG are evaluated concurrently which pays off because
+    NumPy and pandas release the GIL in most of their kernels.
+
+    Since the tasks do not finish in topological order, a node in the garbage
+    collection schedule is released once all tasks which use it are finished.
+
+    Args:
+        func_dict (dict): Maps function names to functions.
+        order (tuple): Nodes of the DAG in topological order.
+        arguments (dict): Maps each node to a tuple of its data dependencies.
+        garbage (dict): Maps each node to a tuple of nodes which can be removed after
+            the node is evaluated.
+        results (dict): Dictionary with the data.
+        n_workers (int): Number of threads. Defaults to the number of CPUs.
+
+    Returns:
+        dict: Dictionary of pd.Series with the results.
+
+    """
+    n_workers = os.cpu_count() if n_workers is None else n_workers
+
+    tasks, n_missing, consumers, n_consumers = _prepare_dynamic_schedule(
+        func_dict, order, arguments, garbage, results
+    )
+    _release(results, [node for node, n in n_consumers.items() if n == 0])
+
+    position = {task: i for i, task in enumerate(order)}
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+
+        def submit(task):
+            kwargs = _dict_subset(results, arguments[task])
+            future = executor.submit(evaluate_task, func_dict[task], kwargs)
+            running[future] = task
+
+        for task in tasks:
+            if n_missing[task] == 0:
+                submit(task)
+
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            # Process finished tasks in topological order to submit new tasks in a
+            # reproducible order.
+            for future in sorted(done, key=lambda f: position[running[f]]):
+                task = running.pop(future)
+                results[task] = future.result()
+
+                _release(results, _finish(task, arguments, n_consumers))
+
+                for consumer in consumers.get(task, ()):
+                    n_missing[consumer] -= 1
+                    if n_missing[consumer] == 0:
+                        submit(consumer)
+
+    return _sort_results(results, order)
+
+
+def execute_processes(func_dict, order, arguments, garbage, results, n_workers=None):
+    """Evaluate the tasks in a pool of processes.
+
+    This scheduler helps with functions which hold the GIL, e.g., loops in pure Python.
+    The data and all intermediate results are stored in shared memory, see
+    :mod:`dag_gettsim.shared_columns`. Only the names of the tasks and the handles of
+    the shared memory are sent between processes. The worker processes are forked and
+    inherit the functions, so the functions do not need to be picklable.
+
+    Like the threaded scheduler, tasks are submitted as soon as their dependencies are
+    available and a node is released once all tasks which use it are finished. The
+    targets are copied from shared memory before they are returned.
+
+    Args:
+        func_dict (dict): Maps function names to functions.
+        order (tuple): Nodes of the DAG in topological order.
+        arguments (dict): Maps each node to a tuple of its data dependencies.
+        garbage (dict): Maps each node to a tuple of nodes which can be removed after
+            the node is evaluated.
+        results (dict): Dictionary with the data.
+        n_workers (int): Number of processes. Defaults to the number of CPUs.
+
+    Returns:
+        dict: Dictionary of pd.Series with the results.
+
+    """
+    n_workers = os.cpu_count() if n_workers is None else n_workers
+
+    tasks, n_missing, consumers, n_consumers = _prepare_dynamic_schedule(
+        func_dict, order, arguments, garbage, results
+    )
+    _release(results, [node for node, n in n_consumers.items() if n == 0])
+
+    position = {task: i for i, task in enumerate(order)}
+    running = {}
+    handles = {}
+
+    try:
+        for node in consumers:
+            if node in results:
+                handles[node] = share_column(results[node])
+
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_initialize_worker,
+            initargs=(func_dict,),
+        ) as executor:
+
+            def submit(task):
+                kwargs = _dict_subset(handles, arguments[task])
+                future = executor.submit(_evaluate_in_worker, task, kwargs)
+                running[future] = task
+
+            for task in tasks:
+                if n_missing[task] == 0:
+                    submit(task)
+
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: position[running[f]]):
+                    task = running.pop(future)
+                    handles[task] = future.result()
+
+                    for node in _finish(task, arguments, n_consumers):
+                        results.pop(node, None)
+                        unlink_column(handles.pop(node))
+
+                    for consumer in consumers.get(task, ()):
+                        n_missing[consumer] -= 1
+                        if n_missing[consumer] == 0:
+                            submit(consumer)
+
+        for task in tasks:
+            if task in handles:
+                results[task] = read_column(handles[task])
+
+    finally:
+        for handle in handles.values():
+            unlink_column(handle)
+
+    return _sort_results(results, order)
+
+
+_WORKER_FUNCTIONS = {}
+_WORKER_BLOCKS_IN_USE = []
+
+
+def _initialize_worker(func_dict):
+    _WORKER_FUNCTIONS.update(func_dict)
+
+
+def _evaluate_in_worker(task, handles):
+    kwargs = {}
+    blocks = []
+    for name, handle in handles.items():
+        kwargs[name], attached = attach_column(handle)
+        blocks += attached
+
+    out = evaluate_task(_WORKER_FUNCTIONS[task], kwargs)
+    handle = share_column(out)
+
+    del kwargs, out
+    _WORKER_BLOCKS_IN_USE[:] = close_blocks(_WORKER_BLOCKS_IN_USE + blocks)
+
+    return handle
+
+
+def evaluate_task(func, kwargs):
+    """Evaluate a function and copy read-only arguments if the function mutates them.
+
+    Args:
+        func (callable): The function of a node.
+        kwargs (dict): The arguments of the function.
+
+    Returns:
+        The result of the function.
+
+    """
+    try:
+        out = func(**kwargs)
+    except ValueError as e:
+        if "read-only" not in str(e):
+            raise
+        kwargs = {
+            name: arg.copy() if _is_read_only(arg) else arg
+            for name, arg in kwargs.items()
+        }
+        out = func(**kwargs)
+
+    return out
+
+
+def _is_read_only(column):
+    if isinstance(column, pd.Series):
+        column = column.values
+
+    return isinstance(column, np.ndarray) and not column.flags.writeable
+
+
+def _prepare_dynamic_schedule(func_dict, order, arguments, garbage, results):
+    """Prepare the bookkeeping for schedulers which do not follow the topological order.
+
+    Returns:
+        tasks (list): Tasks which need to be evaluated in topological order.
+        n_missing (dict): Maps each task to the number of unavailable dependencies.
+        consumers (dict): Maps each node to the tasks which use it.
+        n_consumers (dict): Maps each node which can be released to the number of
+            tasks which use it and are not finished.
+
+    """
+    for task in order:
+        if task not in results and task not in func_dict:
+            raise KeyError(f"Missing variable or function: {task}")
+
+    tasks = [task for task in order if task not in results]
+
+    consumers = {}
+    for task in tasks:
+        for node in arguments[task]:
+            consumers.setdefault(node, []).append(task)
+
+    n_missing = {
+        task: sum(node not in results for node in arguments[task]) for task in tasks
+    }
+    n_consumers = {
+        node: len(consumers.get(node, ()))
+        for nodes in garbage.values()
+        for node in nodes
+    }
+
+    return tasks, n_missing, consumers, n_consumers
+
+
+def _finish(task, arguments, n_consumers):
+    """Count down the consumers of the arguments and return the obsolete nodes."""
+    obsolete = []
+    for node in arguments[task]:
+        if node in n_consumers:
+            n_consumers[node] -= 1
+            if n_consumers[node] == 0:
+                obsolete.append(node)
+
+    return obsolete
+
+
+def _release(results, nodes):
+    for node in nodes:
+        results.pop(node, None)
+
+
+def _sort_results(results, order):
+    """Sort the results like a serial scheduler would have produced them."""
+    out = {node: results[node] for node in order if node in results}
+    out.update(results)
+    return out
+
+
+def _dict_subset(dictionary, keys):
+    return {k: dictionary[k] for k in keys}
+
+
+SCHEDULERS = {
+    "serial": execute_serial,
+    "threads": execute_threads,
+    "processes": execute_processes,
+}
@@ -0,0 +1,186 @@
+"""Place columns in shared memory so that other processes can read them without copies.
+
+A column is shared by copying its values and its index into blocks of
+:class:`multiprocessing.shared_memory.SharedMemory`. The returned handle only contains
+the names of the blocks, the dtypes and the shapes and is cheap to send to another
+process which attaches to the blocks and reconstructs the column without copying.
+
+Columns which cannot be represented by a flat buffer, e.g., columns with object dtype,
+are put into the handle itself and are pickled when sent to another process.
+
+"""
+from collections import namedtuple
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pandas as pd
+
+SharedArray = namedtuple("SharedArray", ["shm_name", "dtype", "shape"])
+"""Handle of a NumPy array stored in a block of shared memory."""
+
+SharedColumn = namedtuple("SharedColumn", ["values", "index", "name"])
+"""Handle of a column whose values and index are stored in shared memory.
+
+The index is either a :class:`SharedArray`, a tuple with the start, stop and step of a
+:class:`pandas.RangeIndex` or ``None`` if the column is a NumPy array.
+
+"""
+
+
+def share_column(column):
+    """Copy a column to shared memory.
+
+    Args:
+        column (pd.Series or np.ndarray): The column.
+
+    Returns:
+        handle (SharedColumn or object): The handle of the column or the column itself
+            if it cannot be shared.
+
+    """
+    if isinstance(column, pd.Series):
+        values, index = column.values, column.index
+    elif isinstance(column, np.ndarray):
+        values, index = column, None
+    else:
+        return column
+
+    if not _is_shareable(values):
+        return column
+
+    if index is None:
+        shared_index = None
+    elif isinstance(index, pd.RangeIndex):
+        shared_index = (index.start, index.stop, index.step)
+    elif not isinstance(index, pd.MultiIndex) and _is_shareable(index.values):
+        shared_index = _share_array(index.values)
+    else:
+        return column
+
+    name = column.name if isinstance(column, pd.Series) else None
+
+    return SharedColumn(_share_array(values), shared_index, name)
+
+
+def attach_column(handle):
+    """Reconstruct a column from its handle without copying.
+
+    The column is read-only because its memory is shared with other processes.
+
+    Args:
+        handle (SharedColumn or object): The handle returned by :func:`share_column`.
+
+    Returns:
+        column (pd.Series or np.ndarray): The column backed by shared memory.
+        blocks (list): The attached blocks of shared memory which have to be kept alive
+            as long as the column is used and closed afterwards.
+
+    """
+    if not isinstance(handle, SharedColumn):
+        return handle, []
+
+    values, block = _attach_array(handle.values)
+    blocks = [block]
+
+    if handle.index is None:
+        return values, blocks
+
+    if isinstance(handle.index, SharedArray):
+        index_values, block = _attach_array(handle.index)
+        blocks.append(block)
+        index = pd.Index(index_values, copy=False)
+    else:
+        index = pd.RangeIndex(*handle.index)
+
+    column = pd.Series(values, index=index, name=handle.name, copy=False)
+
+    return column, blocks
+
+
+def read_column(handle):
+    """Copy a column from shared memory into private memory.
+
+    Args:
+        handle (SharedColumn or object): The handle returned by :func:`share_column`.
+
+    Returns:
+        pd.Series or np.ndarray: The column.
+
+    """
+    column, blocks = attach_column(handle)
+    if blocks:
+        if isinstance(column, pd.Series):
+            column = pd.Series(
+                column.values.copy(),
+                index=column.index.copy(deep=True),
+                name=column.name,
+            )
+        else:
+            column = column.copy()
+        close_blocks(blocks)
+
+    return column
+
+
+def unlink_column(handle):
+    """Free the shared memory of a column.
+
+    Args:
+        handle (SharedColumn or object): The handle returned by :func:`share_column`.
+
+    """
+    if isinstance(handle, SharedColumn):
+        for array in [handle.values, handle.index]:
+            if isinstance(array, SharedArray):
+                block = SharedMemory(name=array.shm_name)
+                block.close()
+                block.unlink()
+
+
+def close_blocks(blocks):
+    """Close the blocks of shared memory attached in this process.
+
+    A block which is still referenced by an array cannot be closed.
+
+    Args:
+        blocks (list): Blocks of shared memory.
+
+    Returns:
+        list: The blocks which are still in use and have to be closed later.
+
+    """
+    in_use = []
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            in_use.append(block)
+
+    return in_use
+
+
+def _is_shareable(values):
+    return isinstance(values, np.ndarray) and not values.dtype.hasobject
+
+
+def _share_array(array):
+    array = np.ascontiguousarray(array)
+    block = SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.frombuffer(block.buf, dtype=array.dtype, count=array.size)
+    view[...] = array.ravel()
+    del view
+    block.close()
+
+    return SharedArray(block.name, array.dtype.str, array.shape)
+
+
+def _attach_array(handle):
+    block = SharedMemory(name=handle.shm_name)
+    # Unlike ``np.ndarray(buffer=...)``, ``np.frombuffer`` holds on to the buffer of the
+    # block which prevents closing the block while the array is alive.
+    dtype = np.dtype(handle.dtype)
+    array = np.frombuffer(block.buf, dtype=dtype, count=int(np.prod(handle.shape)))
+    array = array.reshape(handle.shape)
+    array.flags.writeable = False
+
+    return array, block
@@ -1,5 +1,4 @@
 import numpy as np
-import pandas as pd
 
 
 def sozialv_beitr_m(
@@ -9,43 +8,42 @@ def sozialv_beitr_m(
         pflegev_beitr_m + ges_krankv_beitr_m + rentenv_beitr_m + arbeitsl_v_beitr_m
     )
 
-    return pd.Series(data=sozialv_beitr_m, name="sozialv_beitr_m")
+    return sozialv_beitr_m
 
 
 def rentenv_beitr_m(
-    geringfügig_beschäftigt, rentenv_beitr_regular_job, an_beitr_rentenv_midi_job,
+    geringfügig_beschäftigt,
+    in_gleitzone,
+    regulär_beschäftigt,
+    rentenv_beitr_regular_job,
+    an_beitr_rentenv_midi_job,
 ):
-
-    rentenv_beitr_m = pd.Series(
-        index=geringfügig_beschäftigt.index, name="rentenv_beitr_m", dtype=float
+    # Assign calculated contributions where regular employment takes precedence over
+    # midi jobs. Set contribution 0 for people in minijob.
+    rentenv_beitr_m = np.select(
+        [regulär_beschäftigt, in_gleitzone, geringfügig_beschäftigt],
+        [rentenv_beitr_regular_job, an_beitr_rentenv_midi_job, 0],
+        default=np.nan,
     )
 
-    # Set contribution 0 for people in minijob
-    rentenv_beitr_m.loc[geringfügig_beschäftigt] = 0
-
-    # Assign calculated contributions
-    rentenv_beitr_m.loc[an_beitr_rentenv_midi_job.index] = an_beitr_rentenv_midi_job
-    rentenv_beitr_m.loc[rentenv_beitr_regular_job.index] = rentenv_beitr_regular_job
-
     return rentenv_beitr_m
 
 
 def arbeitsl_v_beitr_m(
-    geringfügig_beschäftigt, an_beitr_arbeitsl_v_midi_job, arbeitsl_v_regular_job,
+    geringfügig_beschäftigt,
+    in_gleitzone,
+    regulär_beschäftigt,
+    an_beitr_arbeitsl_v_midi_job,
+    arbeitsl_v_regular_job,
 ):
-    arbeitsl_v_beitr_m = pd.Series(
-        index=geringfügig_beschäftigt.index, name="arbeitsl_v_beitr_m", dtype=float
+    # Assign calculated contributions where regular employment takes precedence over
+    # midi jobs. Set contribution 0 for people in minijob.
+    arbeitsl_v_beitr_m = np.select(
+        [regulär_beschäftigt, in_gleitzone, geringfügig_beschäftigt],
+        [arbeitsl_v_regular_job, an_beitr_arbeitsl_v_midi_job, 0],
+        default=np.nan,
     )
 
-    # Set contribution 0 for people in minijob
-    arbeitsl_v_beitr_m.loc[geringfügig_beschäftigt] = 0
-
-    # Assign calculated contributions
-    arbeitsl_v_beitr_m.loc[
-        an_beitr_arbeitsl_v_midi_job.index
-    ] = an_beitr_arbeitsl_v_midi_job
-    arbeitsl_v_beitr_m.loc[arbeitsl_v_regular_job.index] = arbeitsl_v_regular_job
-
     return arbeitsl_v_beitr_m
 
 
@@ -64,10 +62,8 @@ def arbeitsl_v_regular_job(lohn_rente_regulär_beschäftigt, params):
     -------
 
     """
-    out = lohn_rente_regulär_beschäftigt.multiply(
-        params["soz_vers_beitr"]["arbeitsl_v"]
-    )
-    return out.rename("arbeitsl_v_regular_job")
+    out = lohn_rente_regulär_beschäftigt * params["soz_vers_beitr"]["arbeitsl_v"]
+    return out
 
 
 def rentenv_beitr_regular_job(lohn_rente_regulär_beschäftigt, params):
@@ -85,8 +81,8 @@ def rentenv_beitr_regular_job(lohn_rente_regulär_beschäftigt, params):
     -------
 
     """
-    out = lohn_rente_regulär_beschäftigt.multiply(params["soz_vers_beitr"]["rentenv"])
-    return out.rename("rentenv_beitr_regular_job")
+    out = lohn_rente_regulär_beschäftigt * params["soz_vers_beitr"]["rentenv"]
+    return out
 
 
 def rentenv_beitr_bemess_grenze(wohnort_ost, params):
@@ -104,16 +100,12 @@ def rentenv_beitr_bemess_grenze(wohnort_ost, params):
     -------
 
     """
-    out = np.select(
-        [wohnort_ost, ~wohnort_ost],
-        [
-            params["beitr_bemess_grenze"]["rentenv"]["ost"],
-            params["beitr_bemess_grenze"]["rentenv"]["west"],
-        ],
-    )
-    return pd.Series(
-        index=wohnort_ost.index, data=out, name="rentenv_beitr_bemess_grenze"
+    out = np.where(
+        wohnort_ost,
+        params["beitr_bemess_grenze"]["rentenv"]["ost"],
+        params["beitr_bemess_grenze"]["rentenv"]["west"],
     )
+    return out
 
 
 def lohn_rente_regulär_beschäftigt(
@@ -136,14 +128,15 @@ def lohn_rente_regulär_beschäftigt(
 
     Returns
     -------
+    The wage for regularly employed individuals and zero for all others.
 
     """
-    bruttolohn_m_regulär_beschäftigt = bruttolohn_m.loc[regulär_beschäftigt]
-    bemess_grenze = rentenv_beitr_bemess_grenze.loc[regulär_beschäftigt]
-    out = bruttolohn_m_regulär_beschäftigt.where(
-        bruttolohn_m_regulär_beschäftigt < bemess_grenze, bemess_grenze
+    out = np.where(
+        bruttolohn_m < rentenv_beitr_bemess_grenze,
+        bruttolohn_m,
+        rentenv_beitr_bemess_grenze,
     )
-    return out.rename("lohn_rente_regulär_beschäftigt")
+    return np.where(regulär_beschäftigt, out, 0)
 
 
 def ges_beitr_arbeitsl_v_midi_job(midi_job_bemessungsentgelt, params):
@@ -161,10 +154,8 @@ def ges_beitr_arbeitsl_v_midi_job(midi_job_bemessungsentgelt, params):
     -------
 
     """
-    out = midi_job_bemessungsentgelt.multiply(
-        2 * params["soz_vers_beitr"]["arbeitsl_v"]
-    )
-    return out.rename("ges_beitr_arbeitsl_v_midi_job")
+    out = midi_job_bemessungsentgelt * (2 * params["soz_vers_beitr"]["arbeitsl_v"])
+    return out
 
 
 def ges_beitr_rentenv_midi_job(midi_job_bemessungsentgelt, params):
@@ -182,8 +173,8 @@ def ges_beitr_rentenv_midi_job(midi_job_bemessungsentgelt, params):
     -------
 
     """
-    out = midi_job_bemessungsentgelt.multiply(2 * params["soz_vers_beitr"]["rentenv"])
-    return out.rename("ges_beitr_rentenv_midi_job")
+    out = midi_job_bemessungsentgelt * (2 * params["soz_vers_beitr"]["rentenv"])
+    return out
 
 
 def ag_beitr_rentenv_midi_job(bruttolohn_m, in_gleitzone, params):
@@ -202,9 +193,8 @@ def ag_beitr_rentenv_midi_job(bruttolohn_m, in_gleitzone, params):
     -------
 
     """
-    bruttolohn_m_in_gleitzone = bruttolohn_m.loc[in_gleitzone]
-    out = bruttolohn_m_in_gleitzone.multiply(params["soz_vers_beitr"]["rentenv"])
-    return out.rename("ag_beitr_rentenv_midi_job")
+    out = np.where(in_gleitzone, bruttolohn_m * params["soz_vers_beitr"]["rentenv"], 0)
+    return out
 
 
 def ag_beitr_arbeitsl_v_midi_job(bruttolohn_m, in_gleitzone, params):
@@ -223,9 +213,10 @@ def ag_beitr_arbeitsl_v_midi_job(bruttolohn_m, in_gleitzone, params):
     -------
 
     """
-    bruttolohn_m_in_gleitzone = bruttolohn_m.loc[in_gleitzone]
-    out = bruttolohn_m_in_gleitzone.multiply(params["soz_vers_beitr"]["arbeitsl_v"])
-    return out.rename("ag_beitr_arbeitsl_v_midi_job")
+    out = np.where(
+        in_gleitzone, bruttolohn_m * params["soz_vers_beitr"]["arbeitsl_v"], 0
+    )
+    return out
 
 
 def an_beitr_rentenv_midi_job(ges_beitr_rentenv_midi_job, ag_beitr_rentenv_midi_job):
@@ -246,7 +237,7 @@ def an_beitr_rentenv_midi_job(ges_beitr_rentenv_midi_job, ag_beitr_rentenv_midi_
 
     """
     out = ges_beitr_rentenv_midi_job - ag_beitr_rentenv_midi_job
-    return out.rename("an_beitr_rentenv_midi_job")
+    return out
 
 
 def an_beitr_arbeitsl_v_midi_job(
@@ -269,4 +260,4 @@ def an_beitr_arbeitsl_v_midi_job(
 
     """
     out = ges_beitr_arbeitsl_v_midi_job - ag_beitr_arbeitsl_v_midi_job
-    return out.rename("an_beitr_arbeitsl_v_midi_job")
+    return out
@@ -1,5 +1,4 @@
 import numpy as np
-import pandas as pd
 
 
 def mini_job_grenze(wohnort_ost, params):
@@ -14,16 +13,14 @@ def mini_job_grenze(wohnort_ost, params):
 
     Returns
     -------
-    Pandas Series containing the income threshold for marginal employment.
+    Array containing the income threshold for marginal employment.
     """
-    out = np.select(
-        [wohnort_ost, ~wohnort_ost],
-        [
-            params["geringfügige_eink_grenzen"]["mini_job"]["ost"],
-            params["geringfügige_eink_grenzen"]["mini_job"]["west"],
-        ],
+    out = np.where(
+        wohnort_ost,
+        params["geringfügige_eink_grenzen"]["mini_job"]["ost"],
+        params["geringfügige_eink_grenzen"]["mini_job"]["west"],
     )
-    return pd.Series(index=wohnort_ost.index, data=out, name="mini_job_grenze")
+    return out
 
 
 def geringfügig_beschäftigt(bruttolohn_m, mini_job_grenze):
@@ -38,12 +35,11 @@ def geringfügig_beschäftigt(bruttolohn_m, mini_job_grenze):
 
     Returns
     -------
-    Pandas Series containing a boolean variable indicating if individual is marginal
-    employed.
+    Boolean variable indicating if individual is marginal employed.
 
     """
-    out = bruttolohn_m.le(mini_job_grenze)
-    return out.rename("geringfügig_beschäftigt")
+    out = bruttolohn_m <= mini_job_grenze
+    return out
 
 
 def in_gleitzone(bruttolohn_m, geringfügig_beschäftigt, params):
@@ -61,13 +57,13 @@ def in_gleitzone(bruttolohn_m, geringfügig_beschäftigt, params):
 
     Returns
     -------
-    Pandas Series containing a boolean variable indicating if individual's wage is more
-    then marginal employment threshold but less than regular employment.
+    Boolean variable indicating if individual's wage is more then marginal employment
+    threshold but less than regular employment.
     """
-    out = (bruttolohn_m.le(params["geringfügige_eink_grenzen"]["midi_job"])) & (
+    out = (bruttolohn_m <= params["geringfügige_eink_grenzen"]["midi_job"]) & (
         ~geringfügig_beschäftigt
     )
-    return out.rename("in_gleitzone")
+    return out
 
 
 def midi_job_bemessungsentgelt(bruttolohn_m, in_gleitzone, params):
@@ -85,6 +81,7 @@ def midi_job_bemessungsentgelt(bruttolohn_m, in_gleitzone, params):
 
     Returns
     -------
+    The Bemessungsentgelt for individuals in the Gleitzone and zero for all others.
 
     """
     # First calculate the factor F from the formula in § 163 (10) SGB VI.
@@ -111,8 +108,7 @@ def midi_job_bemessungsentgelt(bruttolohn_m, in_gleitzone, params):
     # Now use the factor to calculate the overall bemessungsentgelt
     mini_job_anteil = f * params["geringfügige_eink_grenzen"]["mini_job"]["west"]
     lohn_über_mini = (
-        bruttolohn_m.loc[in_gleitzone]
-        - params["geringfügige_eink_grenzen"]["mini_job"]["west"]
+        bruttolohn_m - params["geringfügige_eink_grenzen"]["mini_job"]["west"]
     )
     gewichtete_midi_job_rate = (
         params["geringfügige_eink_grenzen"]["midi_job"]
@@ -128,8 +124,10 @@ def midi_job_bemessungsentgelt(bruttolohn_m, in_gleitzone, params):
         )
         * f
     )
-    out = mini_job_anteil + lohn_über_mini * gewichtete_midi_job_rate
-    return out.rename("midi_job_bemessungsentgelt")
+    out = np.where(
+        in_gleitzone, mini_job_anteil + lohn_über_mini * gewichtete_midi_job_rate, 0
+    )
+    return out
 
 
 def regulär_beschäftigt(bruttolohn_m, params):
@@ -145,5 +143,5 @@ def regulär_beschäftigt(bruttolohn_m, params):
     -------
 
     """
-    out = bruttolohn_m.ge(params["geringfügige_eink_grenzen"]["midi_job"])
-    return out.rename("regulär_beschäftigt")
+    out = bruttolohn_m >= params["geringfügige_eink_grenzen"]["midi_job"]
+    return out
@@ -1,56 +1,71 @@
 import numpy as np
-import pandas as pd
 
 
 def ges_krankv_beitr_m(
     geringfügig_beschäftigt,
+    in_gleitzone,
+    regulär_beschäftigt,
+    selbsständig_ges_krankv,
     ges_krankv_beitr_rente,
     ges_krankv_beitr_selbst,
     krankv_beitr_regulär_beschäftigt,
     an_beitr_krankv_midi_job,
 ):
-
-    ges_krankv_beitr_m = pd.Series(
-        index=geringfügig_beschäftigt.index, name="ges_krankv_beitr_m", dtype=float
+    # Assign calculated contributions where self-employment takes precedence over
+    # regular employment and regular employment over midi jobs. Set contribution 0 for
+    # people in minijob.
+    ges_krankv_beitr_m = np.select(
+        [
+            selbsständig_ges_krankv,
+            regulär_beschäftigt,
+            in_gleitzone,
+            geringfügig_beschäftigt,
+        ],
+        [
+            ges_krankv_beitr_selbst,
+            krankv_beitr_regulär_beschäftigt,
+            an_beitr_krankv_midi_job,
+            0,
+        ],
+        default=np.nan,
     )
 
-    ges_krankv_beitr_m.loc[geringfügig_beschäftigt] = 0
-
-    # Assign calculated contributions
-    ges_krankv_beitr_m.loc[an_beitr_krankv_midi_job.index] = an_beitr_krankv_midi_job
-    ges_krankv_beitr_m.loc[
-        krankv_beitr_regulär_beschäftigt.index
-    ] = krankv_beitr_regulär_beschäftigt
-    ges_krankv_beitr_m.loc[ges_krankv_beitr_selbst.index] = ges_krankv_beitr_selbst
-
     # Add the health insurance contribution for pensions
-    ges_krankv_beitr_m += ges_krankv_beitr_rente
+    ges_krankv_beitr_m = ges_krankv_beitr_m + ges_krankv_beitr_rente
     return ges_krankv_beitr_m
 
 
 def pflegev_beitr_m(
     geringfügig_beschäftigt,
+    in_gleitzone,
+    regulär_beschäftigt,
+    selbsständig_ges_krankv,
     pflegev_beitr_rente,
     pflegev_beitr_selbst,
     pflegev_beitr_regulär_beschäftigt,
     an_beitr_pflegev_midi_job,
 ):
-
-    pflegev_beitr_m = pd.Series(
-        index=geringfügig_beschäftigt.index, name="pflegev_beitr_m", dtype=float
+    # Assign calculated contributions where self-employment takes precedence over
+    # regular employment and regular employment over midi jobs. Set contribution 0 for
+    # people in minijob.
+    pflegev_beitr_m = np.select(
+        [
+            selbsständig_ges_krankv,
+            regulär_beschäftigt,
+            in_gleitzone,
+            geringfügig_beschäftigt,
+        ],
+        [
+            pflegev_beitr_selbst,
+            pflegev_beitr_regulär_beschäftigt,
+            an_beitr_pflegev_midi_job,
+            0,
+        ],
+        default=np.nan,
     )
 
-    pflegev_beitr_m.loc[geringfügig_beschäftigt] = 0
-
-    # Assign calculated contributions
-    pflegev_beitr_m.loc[an_beitr_pflegev_midi_job.index] = an_beitr_pflegev_midi_job
-    pflegev_beitr_m.loc[
-        pflegev_beitr_regulär_beschäftigt.index
-    ] = pflegev_beitr_regulär_beschäftigt
-    pflegev_beitr_m.loc[pflegev_beitr_selbst.index] = pflegev_beitr_selbst
-
     # Add the care insurance contribution for pensions
-    pflegev_beitr_m += pflegev_beitr_rente
+    pflegev_beitr_m = pflegev_beitr_m + pflegev_beitr_rente
 
     return pflegev_beitr_m
 
@@ -71,7 +86,7 @@ def krankv_beitr_regulär_beschäftigt(lohn_krankv_regulär_beschäftigt, params
     income.
     """
     out = params["soz_vers_beitr"]["ges_krankv"]["an"] * lohn_krankv_regulär_beschäftigt
-    return out.rename("krankv_beitr_regulär_beschäftigt")
+    return out
 
 
 def pflegev_beitr_regulär_beschäftigt(
@@ -95,15 +110,18 @@ def pflegev_beitr_regulär_beschäftigt(
     Pandas Series containing monthly care insurance contributions for self employed
     income.
     """
-    out = lohn_krankv_regulär_beschäftigt.multiply(
-        params["soz_vers_beitr"]["pflegev"]["standard"]
+    out = (
+        lohn_krankv_regulär_beschäftigt * params["soz_vers_beitr"]["pflegev"]["standard"]
+    )
+    zusatz_kinderlos = np.where(
+        pflegev_zusatz_kinderlos,
+        lohn_krankv_regulär_beschäftigt
+        * params["soz_vers_beitr"]["pflegev"]["zusatz_kinderlos"],
+        0,
     )
-    zusatz_kinderlos = lohn_krankv_regulär_beschäftigt.loc[
-        pflegev_zusatz_kinderlos
-    ].multiply(params["soz_vers_beitr"]["pflegev"]["zusatz_kinderlos"])
 
-    out.loc[pflegev_zusatz_kinderlos] += zusatz_kinderlos
-    return out.rename("pflegev_beitr_regulär_beschäftigt")
+    out = out + zusatz_kinderlos
+    return out
 
 
 def lohn_krankv_regulär_beschäftigt(
@@ -125,14 +143,15 @@ def lohn_krankv_regulär_beschäftigt(
 
     Returns
     -------
+    The wage for regularly employed individuals and zero for all others.
 
     """
-    bruttolohn_m_regulär_beschäftigt = bruttolohn_m.loc[regulär_beschäftigt]
-    bemess_grenze = krankv_beitr_bemess_grenze.loc[regulär_beschäftigt]
-    out = bruttolohn_m_regulär_beschäftigt.where(
-        bruttolohn_m_regulär_beschäftigt < bemess_grenze, bemess_grenze
+    out = np.where(
+        bruttolohn_m < krankv_beitr_bemess_grenze,
+        bruttolohn_m,
+        krankv_beitr_bemess_grenze,
     )
-    return out.rename("lohn_krankv_regulär_beschäftigt")
+    return np.where(regulär_beschäftigt, out, 0)
 
 
 def ges_krankv_beitr_selbst(krankv_pflichtig_eink_selbst, params):
@@ -157,8 +176,8 @@ def ges_krankv_beitr_selbst(krankv_pflichtig_eink_selbst, params):
         params["soz_vers_beitr"]["ges_krankv"]["an"]
         + params["soz_vers_beitr"]["ges_krankv"]["ag"]
     )
-    out = krankv_pflichtig_eink_selbst.multiply(beitr_satz)
-    return out.rename("ges_krankv_beitr_selbst")
+    out = krankv_pflichtig_eink_selbst * beitr_satz
+    return out
 
 
 def pflegev_beitr_selbst(
@@ -185,15 +204,18 @@ def pflegev_beitr_selbst(
     Pandas Series containing monthly care insurance contributions for self employed
     income.
     """
-    out = krankv_pflichtig_eink_selbst.multiply(
+    out = krankv_pflichtig_eink_selbst * (
         2 * params["soz_vers_beitr"]["pflegev"]["standard"]
     )
-    zusatz_kinderlos = krankv_pflichtig_eink_selbst.loc[
-        pflegev_zusatz_kinderlos
-    ].multiply(params["soz_vers_beitr"]["pflegev"]["zusatz_kinderlos"])
+    zusatz_kinderlos = np.where(
+        pflegev_zusatz_kinderlos,
+        krankv_pflichtig_eink_selbst
+        * params["soz_vers_beitr"]["pflegev"]["zusatz_kinderlos"],
+        0,
+    )
 
-    out.loc[pflegev_zusatz_kinderlos] += zusatz_kinderlos
-    return out.rename("pflegev_beitr_selbst")
+    out = out + zusatz_kinderlos
+    return out
 
 
 def bezugsgröße(wohnort_ost, params):
@@ -210,11 +232,10 @@ def bezugsgröße(wohnort_ost, params):
     Returns
     -------
     """
-    out = np.select(
-        [wohnort_ost, ~wohnort_ost],
-        [params["bezugsgröße"]["ost"], params["bezugsgröße"]["west"]],
+    out = np.where(
+        wohnort_ost, params["bezugsgröße"]["ost"], params["bezugsgröße"]["west"]
     )
-    return pd.Series(index=wohnort_ost.index, data=out, name="bezugsgröße")
+    return out
 
 
 def krankv_pflichtig_eink_selbst(eink_selbst_m, bezugsgröße, selbsständig_ges_krankv):
@@ -235,15 +256,15 @@ def krankv_pflichtig_eink_selbst(eink_selbst_m, bezugsgröße, selbsständig_ges
 
     Returns
     -------
+    The income for selfemployed and public health insured individuals and zero for
+    all others.
 
     """
-    bezugsgröße_selbstv = bezugsgröße.loc[selbsständig_ges_krankv]
-    eink_selbst_m_selbstv = eink_selbst_m.loc[selbsständig_ges_krankv]
-    dreiviertel_bezugsgröße = bezugsgröße_selbstv.multiply(0.75)
-    out = eink_selbst_m_selbstv.where(
-        eink_selbst_m_selbstv < dreiviertel_bezugsgröße, dreiviertel_bezugsgröße
+    dreiviertel_bezugsgröße = bezugsgröße * 0.75
+    out = np.where(
+        eink_selbst_m < dreiviertel_bezugsgröße, eink_selbst_m, dreiviertel_bezugsgröße
     )
-    return out.rename("krankv_pflichtig_eink_selbst")
+    return np.where(selbsständig_ges_krankv, out, 0)
 
 
 def krankv_pflichtig_rente(ges_rente_m, krankv_beitr_bemess_grenze):
@@ -263,10 +284,12 @@ def krankv_pflichtig_rente(ges_rente_m, krankv_beitr_bemess_grenze):
     -------
 
     """
-    out = ges_rente_m.where(
-        ges_rente_m < krankv_beitr_bemess_grenze, krankv_beitr_bemess_grenze
+    out = np.where(
+        ges_rente_m < krankv_beitr_bemess_grenze,
+        ges_rente_m,
+        krankv_beitr_bemess_grenze,
     )
-    return out.rename("krankv_pflichtig_rente")
+    return out
 
 
 def krankv_beitr_bemess_grenze(wohnort_ost, params):
@@ -282,20 +305,16 @@ def krankv_beitr_bemess_grenze(wohnort_ost, params):
 
     Returns
     -------
-    Pandas Series containing the income threshold up to which the rate of health
-    insurance contributions apply.
+    Array containing the income threshold up to which the rate of health insurance
+    contributions apply.
 
     """
-    out = np.select(
-        [wohnort_ost, ~wohnort_ost],
-        [
-            params["beitr_bemess_grenze"]["ges_krankv"]["ost"],
-            params["beitr_bemess_grenze"]["ges_krankv"]["west"],
-        ],
-    )
-    return pd.Series(
-        data=out, index=wohnort_ost.index, name="krankv_beitr_bemess_grenze"
+    out = np.where(
+        wohnort_ost,
+        params["beitr_bemess_grenze"]["ges_krankv"]["ost"],
+        params["beitr_bemess_grenze"]["ges_krankv"]["west"],
     )
+    return out
 
 
 def pflegev_beitr_rente(pflegev_zusatz_kinderlos, krankv_pflichtig_rente, params):
@@ -316,15 +335,16 @@ def pflegev_beitr_rente(pflegev_zusatz_kinderlos, krankv_pflichtig_rente, params
     -------
     Pandas Series containing monthly health insurance contributions for pension income.
     """
-    out = krankv_pflichtig_rente.multiply(
-        2 * params["soz_vers_beitr"]["pflegev"]["standard"]
-    )
-    zusatz_kinderlos = krankv_pflichtig_rente.loc[pflegev_zusatz_kinderlos].multiply(
-        params["soz_vers_beitr"]["pflegev"]["zusatz_kinderlos"]
+    out = krankv_pflichtig_rente * (2 * params["soz_vers_beitr"]["pflegev"]["standard"])
+    zusatz_kinderlos = np.where(
+        pflegev_zusatz_kinderlos,
+        krankv_pflichtig_rente
+        * params["soz_vers_beitr"]["pflegev"]["zusatz_kinderlos"],
+        0,
     )
 
-    out.loc[pflegev_zusatz_kinderlos] += zusatz_kinderlos
-    return out.rename("pflegev_beitr_rente")
+    out = out + zusatz_kinderlos
+    return out
 
 
 def ges_krankv_beitr_rente(krankv_pflichtig_rente, params):
@@ -344,7 +364,7 @@ def ges_krankv_beitr_rente(krankv_pflichtig_rente, params):
     """
 
     out = params["soz_vers_beitr"]["ges_krankv"]["an"] * krankv_pflichtig_rente
-    return out.rename("ges_krankv_beitr_rente")
+    return out
 
 
 def ges_beitr_krankv_midi_job(midi_job_bemessungsentgelt, params):
@@ -366,7 +386,7 @@ def ges_beitr_krankv_midi_job(midi_job_bemessungsentgelt, params):
         params["soz_vers_beitr"]["ges_krankv"]["an"]
         + params["soz_vers_beitr"]["ges_krankv"]["ag"]
     ) * midi_job_bemessungsentgelt
-    return out.rename("ges_beitr_krankv_midi_job")
+    return out
 
 
 def ag_beitr_krankv_midi_job(bruttolohn_m, in_gleitzone, params):
@@ -385,11 +405,10 @@ def ag_beitr_krankv_midi_job(bruttolohn_m, in_gleitzone, params):
     -------
 
     """
-    bruttolohn_m_in_gleitzone = bruttolohn_m.loc[in_gleitzone]
-    out = bruttolohn_m_in_gleitzone.multiply(
-        params["soz_vers_beitr"]["ges_krankv"]["ag"]
+    out = np.where(
+        in_gleitzone, bruttolohn_m * params["soz_vers_beitr"]["ges_krankv"]["ag"], 0
     )
-    return out.rename("ag_beitr_krankv_midi_job")
+    return out
 
 
 def an_beitr_pflegev_midi_job(ges_beitr_pflegev_midi_job, ag_beitr_pflegev_midi_job):
@@ -410,7 +429,7 @@ def an_beitr_pflegev_midi_job(ges_beitr_pflegev_midi_job, ag_beitr_pflegev_midi_
 
     """
     out = ges_beitr_pflegev_midi_job - ag_beitr_pflegev_midi_job
-    return out.rename("an_beitr_pflegev_midi_job")
+    return out
 
 
 def an_beitr_krankv_midi_job(ges_beitr_krankv_midi_job, ag_beitr_krankv_midi_job):
@@ -431,7 +450,7 @@ def an_beitr_krankv_midi_job(ges_beitr_krankv_midi_job, ag_beitr_krankv_midi_job
 
     """
     out = ges_beitr_krankv_midi_job - ag_beitr_krankv_midi_job
-    return out.rename("an_beitr_krankv_midi_job")
+    return out
 
 
 def ag_beitr_pflegev_midi_job(bruttolohn_m, in_gleitzone, params):
@@ -450,11 +469,10 @@ def ag_beitr_pflegev_midi_job(bruttolohn_m, in_gleitzone, params):
     -------
 
     """
-    bruttolohn_m_in_gleitzone = bruttolohn_m.loc[in_gleitzone]
-    out = bruttolohn_m_in_gleitzone.multiply(
-        params["soz_vers_beitr"]["pflegev"]["standard"]
+    out = np.where(
+        in_gleitzone, bruttolohn_m * params["soz_vers_beitr"]["pflegev"]["standard"], 0
     )
-    return out.rename("ag_beitr_pflegev_midi_job")
+    return out
 
 
 def ges_beitr_pflegev_midi_job(
@@ -478,16 +496,19 @@ def ges_beitr_pflegev_midi_job(
     -------
 
     """
-    out = midi_job_bemessungsentgelt.multiply(
+    out = midi_job_bemessungsentgelt * (
         2 * params["soz_vers_beitr"]["pflegev"]["standard"]
     )
-    zusatz_kinderlos = midi_job_bemessungsentgelt.loc[
-        pflegev_zusatz_kinderlos
-    ].multiply(params["soz_vers_beitr"]["pflegev"]["zusatz_kinderlos"])
+    zusatz_kinderlos = np.where(
+        pflegev_zusatz_kinderlos,
+        midi_job_bemessungsentgelt
+        * params["soz_vers_beitr"]["pflegev"]["zusatz_kinderlos"],
+        0,
+    )
 
-    out.loc[pflegev_zusatz_kinderlos] += zusatz_kinderlos
+    out = out + zusatz_kinderlos
 
-    return out.rename("ges_beitr_pflegev_midi_job")
+    return out
 
 
 def selbsständig_ges_krankv(selbstständig, prv_krankv):
@@ -525,4 +546,4 @@ def pflegev_zusatz_kinderlos(hat_kinder, alter):
 
     """
     # Todo: No hardcoded 22.
-    return ~hat_kinder & alter.gt(22)
+    return ~hat_kinder & (alter > 22)
@@ -0,0 +1,182 @@
+"""Stream datasets through a compiled DAG in chunks of rows.
+
+All functions of gettsim work on the level of individuals, i.e., each row can be
+computed independently of the other rows. Thus, a dataset which does not fit into
+memory can be processed chunk by chunk and the results are identical to processing the
+whole dataset at once.
+
+"""
+import pandas as pd
+
+from dag_gettsim.dag import compile_dag
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    IS_PYARROW_INSTALLED = False
+else:
+    IS_PYARROW_INSTALLED = True
+
+
+def compute_taxes_and_transfers_in_chunks(
+    chunks,
+    functions=None,
+    params=None,
+    targets="all",
+    chunk_size=None,
+    scheduler="serial",
+    n_workers=None,
+):
+    """Simulate a tax and transfer system on a dataset which is split into chunks.
+
+    Args:
+        chunks (pd.DataFrame, dict or iterable): The dataset as a single DataFrame or
+            dictionary of columns or an iterable of those, each holding a chunk of
+            rows.
+        functions (dict): Dictionary with user provided functions. See
+            :func:`~dag_gettsim.dag.compute_taxes_and_transfers`.
+        params (dict): Dictionary with parameters.
+        targets (list): List of strings with names of functions whose output is actually
+            needed by the user. By default, the results of all functions are returned.
+        chunk_size (int): Maximum number of rows per chunk. Larger chunks are split. By
+            default, the chunks are processed as they are.
+        scheduler (str): Scheduler used for each chunk. See
+            :func:`~dag_gettsim.dag.execute_dag`.
+        n_workers (int): Number of workers for parallel schedulers.
+
+    Yields:
+        pd.DataFrame: The target quantities for each chunk of rows.
+
+    """
+    plan = compile_dag(functions, targets)
+    yield from run_in_chunks(
+        plan, chunks, params, chunk_size, scheduler=scheduler, n_workers=n_workers
+    )
+
+
+def run_in_chunks(plan, chunks, params=None, chunk_size=None, **kwargs):
+    """Execute a compiled plan on each chunk of rows.
+
+    Args:
+        plan (ExecutionPlan): The compiled plan.
+        chunks (pd.DataFrame, dict or iterable): The dataset as a single DataFrame or
+            dictionary of columns or an iterable of those, each holding a chunk of
+            rows.
+        params (dict): Dictionary with parameters.
+        chunk_size (int): Maximum number of rows per chunk. Larger chunks are split. By
+            default, the chunks are processed as they are.
+        **kwargs: Keyword arguments passed to :meth:`ExecutionPlan.run`.
+
+    Yields:
+        pd.DataFrame: The target quantities for each chunk of rows. The columns are
+            ordered like the targets.
+
+    """
+    if isinstance(chunks, (pd.DataFrame, dict)):
+        chunks = [chunks]
+
+    n_rows_processed = 0
+    for chunk in chunks:
+        for data in iter_row_chunks(chunk, chunk_size):
+            data = _to_series(data, n_rows_processed)
+            results = plan.run(data, params, squeeze=False, **kwargs)
+            n_rows_processed += _n_rows(data)
+            columns = list(results) if plan.targets == "all" else plan.targets
+            yield pd.DataFrame(results, columns=columns)
+
+
+def iter_row_chunks(data, chunk_size=None):
+    """Split a dataset into chunks of rows.
+
+    Args:
+        data (pd.DataFrame or dict): DataFrame or dictionary of Series or arrays with
+            equal length.
+        chunk_size (int): Maximum number of rows per chunk. If ``None``, the data is
+            returned as a single chunk.
+
+    Yields:
+        dict: Dictionary of columns holding the rows of a chunk. The columns are views
+            on the original data.
+
+    """
+    columns = dict(data)
+    n_rows = _n_rows(columns)
+
+    if chunk_size is None or n_rows <= chunk_size:
+        yield columns
+    elif chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+    else:
+        for start in range(0, n_rows, chunk_size):
+            yield {
+                name: _slice_rows(column, start, start + chunk_size)
+                for name, column in columns.items()
+            }
+
+
+def write_chunks_to_parquet(result_chunks, path):
+    """Write chunks of results to a single Parquet file.
+
+    The chunks are written one after another, so only one chunk is held in memory.
+
+    Args:
+        result_chunks (iterable): Iterable of DataFrames with the same columns, e.g.,
+            the output of :func:`compute_taxes_and_transfers_in_chunks`.
+        path (str or pathlib.Path): Path to the Parquet file.
+
+    Returns:
+        int: The number of written rows.
+
+    """
+    if not IS_PYARROW_INSTALLED:
+        raise ImportError("Writing Parquet files requires pyarrow.")
+
+    n_rows = 0
+    writer = None
+    try:
+        for chunk in result_chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=True)
+            if writer is None:
+                writer = pq.ParquetWriter(str(path), table.schema)
+            writer.write_table(table)
+            n_rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return n_rows
+
+
+def _to_series(data, offset):
+    """Convert arrays to Series.
+
+    The arrays get the index of the other Series in the chunk or a range index which
+    continues the index of the previous chunks.
+
+    """
+    indices = [column.index for column in data.values() if isinstance(column, pd.Series)]
+    if indices:
+        index = indices[0]
+    else:
+        index = pd.RangeIndex(offset, offset + _n_rows(data))
+
+    return {
+        name: column
+        if isinstance(column, pd.Series)
+        else pd.Series(column, index=index, name=name, copy=False)
+        for name, column in data.items()
+    }
+
+
+def _n_rows(data):
+    return len(next(iter(data.values()))) if data else 0
+
+
+def _slice_rows(column, start, stop):
+    if isinstance(column, pd.Series):
+        out = column.iloc[start:stop]
+    else:
+        out = column[start:stop]
+
+    return out
@@ -0,0 +1,227 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dag_gettsim.dag import compile_dag
+from dag_gettsim.dag import compute_taxes_and_transfers
+from dag_gettsim.dag import create_dag
+from dag_gettsim.dag import prune_dag
+from gettsim.config import ROOT_DIR
+from gettsim.pre_processing.policy_for_date import get_policies_for_date
+
+INPUT_COLS = [
+    "p_id",
+    "hh_id",
+    "tu_id",
+    "bruttolohn_m",
+    "wohnort_ost",
+    "alter",
+    "selbstständig",
+    "hat_kinder",
+    "eink_selbst_m",
+    "ges_rente_m",
+    "prv_krankv",
+    "jahr",
+]
+YEARS = [2002, 2010, 2018, 2019, 2020]
+OUT_COLS = [
+    "sozialv_beitr_m",
+    "rentenv_beitr_m",
+    "arbeitsl_v_beitr_m",
+    "ges_krankv_beitr_m",
+    "pflegev_beitr_m",
+]
+
+
+@pytest.fixture(scope="module")
+def input_data():
+    file_name = "test_dfs_ssc.csv"
+    out = pd.read_csv(ROOT_DIR / "../dag_gettsim/tests" / file_name)
+    return out
+
+
+def test_compiled_plan_is_reusable(input_data, soz_vers_beitr_raw_data):
+    plan = compile_dag(targets=OUT_COLS)
+
+    for year in YEARS:
+        year_data = input_data[input_data["jahr"] == year]
+        params = get_policies_for_date(
+            year=year, group="soz_vers_beitr", raw_group_data=soz_vers_beitr_raw_data
+        )
+        results = plan.run(dict(year_data[INPUT_COLS]), params)
+
+        assert set(results) == set(OUT_COLS)
+        for column in OUT_COLS:
+            pd.testing.assert_series_equal(results[column], year_data[column])
+
+
+def test_compiled_plan_freezes_order_and_garbage():
+    plan = compile_dag(targets="rentenv_beitr_m")
+
+    assert plan.order.index("mini_job_grenze") < plan.order.index("rentenv_beitr_m")
+    assert "pflegev_beitr_m" not in plan.order
+    assert "params" not in plan.order
+    assert "rentenv_beitr_regular_job" in plan.uses_params
+    assert "rentenv_beitr_m" not in plan.uses_params
+
+    freed = {node for nodes in plan.garbage.values() for node in nodes}
+    assert freed == set(plan.order) - {"rentenv_beitr_m"}
+
+
+def test_missing_variable_raises_key_error():
+    plan = compile_dag(targets="pflegev_zusatz_kinderlos")
+    data = {"alter": pd.Series([30, 40])}
+
+    with pytest.raises(KeyError, match="hat_kinder"):
+        plan.run(data)
+
+
+def test_compute_taxes_and_transfers_returns_dag(input_data, soz_vers_beitr_raw_data):
+    year_data = input_data[input_data["jahr"] == 2018]
+    params = get_policies_for_date(
+        year=2018, group="soz_vers_beitr", raw_group_data=soz_vers_beitr_raw_data
+    )
+    _, dag = compute_taxes_and_transfers(
+        dict(year_data[INPUT_COLS]),
+        params=params,
+        targets="in_gleitzone",
+        return_dag=True,
+    )
+
+    assert set(dag.predecessors("in_gleitzone")) == {
+        "bruttolohn_m",
+        "geringfügig_beschäftigt",
+    }
+
+
+def _a(x):
+    pass
+
+
+def _b(a, params):
+    pass
+
+
+def _c(a, y):
+    pass
+
+
+def _d(b, c):
+    pass
+
+
+def test_prune_dag_keeps_only_ancestors_of_targets():
+    dag = create_dag({"a": _a, "b": _b, "c": _c, "d": _d})
+
+    assert set(dag.edges) == {("x", "a"), ("a", "b"), ("a", "c"), ("y", "c")} | {
+        ("b", "d"),
+        ("c", "d"),
+    }
+
+    pruned = prune_dag(dag, ["b"])
+
+    assert set(pruned.nodes) == {"x", "a", "b"}
+
+
+def test_prune_dag_raises_for_unknown_target():
+    dag = create_dag({"a": _a})
+
+    with pytest.raises(KeyError, match="unknown"):
+        prune_dag(dag, ["unknown"])
+
+
+def _capped_lohn_m(bruttolohn_m):
+    bruttolohn_m.loc[bruttolohn_m > 1_000] = 1_000
+    return bruttolohn_m
+
+
+def test_data_of_caller_is_unchanged(input_data, soz_vers_beitr_raw_data):
+    year_data = input_data[input_data["jahr"] == 2018]
+    data = dict(year_data[INPUT_COLS])
+    expected = {name: column.copy() for name, column in data.items()}
+    params = get_policies_for_date(
+        year=2018, group="soz_vers_beitr", raw_group_data=soz_vers_beitr_raw_data
+    )
+
+    results = compute_taxes_and_transfers(
+        data,
+        functions={"capped_lohn_m": _capped_lohn_m},
+        params=params,
+        targets=["capped_lohn_m", "sozialv_beitr_m"],
+    )
+
+    assert results["capped_lohn_m"].max() == 1_000
+    for name, column in data.items():
+        pd.testing.assert_series_equal(column, expected[name])
+
+
+def test_last_consumers_and_garbage_schedule():
+    plan = compile_dag(functions={"a": _a, "b": _b, "c": _c, "d": _d}, targets="d")
+
+    assert plan.last_consumers["x"] == "a"
+    assert plan.last_consumers["a"] == max("b", "c", key=plan.order.index)
+    assert "d" not in plan.last_consumers
+    assert set(plan.garbage["d"]) == {"b", "c"}
+
+
+def test_targets_all_returns_results_of_all_functions(
+    input_data, soz_vers_beitr_raw_data
+):
+    year_data = input_data[input_data["jahr"] == 2018]
+    params = get_policies_for_date(
+        year=2018, group="soz_vers_beitr", raw_group_data=soz_vers_beitr_raw_data
+    )
+    plan = compile_dag()
+
+    results = plan.run(dict(year_data[INPUT_COLS]), params)
+
+    assert set(results) == set(plan.func_dict)
+    assert not set(results) & set(INPUT_COLS)
+    pd.testing.assert_series_equal(
+        results["sozialv_beitr_m"], year_data["sozialv_beitr_m"]
+    )
+
+
+@pytest.mark.parametrize("scheduler", ["serial", "threads", "processes"])
+def test_numpy_backend_matches_pandas_backend(
+    input_data, soz_vers_beitr_raw_data, scheduler
+):
+    plan = compile_dag(targets=OUT_COLS)
+
+    for year in YEARS:
+        year_data = input_data[input_data["jahr"] == year]
+        params = get_policies_for_date(
+            year=year, group="soz_vers_beitr", raw_group_data=soz_vers_beitr_raw_data
+        )
+        data = dict(year_data[INPUT_COLS])
+        expected = plan.run(data, params, scheduler=scheduler)
+        results = plan.run(data, params, scheduler=scheduler, backend="numpy")
+
+        assert list(results) == list(expected)
+        for column in OUT_COLS:
+            pd.testing.assert_series_equal(results[column], expected[column])
+            pd.testing.assert_series_equal(results[column], year_data[column])
+
+
+def test_numpy_backend_passes_arrays_between_functions():
+    def double(x):
+        assert isinstance(x, np.ndarray)
+        return pd.Series(x * 2)
+
+    def total(double, x):
+        assert isinstance(double, np.ndarray)
+        return double + x
+
+    plan = compile_dag(functions={"double": double, "total": total}, targets="total")
+    data = {"x": pd.Series([1, 2], index=[5, 6])}
+    result = plan.run(data, backend="numpy")
+
+    expected = pd.Series([3, 6], index=[5, 6], name="total")
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_unknown_backend():
+    plan = compile_dag(targets="pflegev_zusatz_kinderlos")
+
+    with pytest.raises(ValueError, match="Unknown backend"):
+        plan.run({"alter": pd.Series([30])}, backend="cupy")
@@ -0,0 +1,67 @@
+import pandas as pd
+import pytest
+
+from dag_gettsim.dag import compute_taxes_and_transfers
+from dag_gettsim.data_loader import get_required_columns
+from dag_gettsim.data_loader import iter_data_chunks
+from dag_gettsim.data_loader import load_data
+from gettsim.config import ROOT_DIR
+from gettsim.pre_processing.policy_for_date import get_policies_for_date
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture(scope="module")
+def input_data():
+    file_name = "test_dfs_ssc.csv"
+    out = pd.read_csv(ROOT_DIR / "../dag_gettsim/tests" / file_name)
+    out = out.loc[:, ~out.columns.str.startswith("Unnamed")]
+    return out
+
+
+@pytest.fixture(params=["parquet", "feather"])
+def path(request, input_data, tmp_path):
+    path = tmp_path / f"data.{request.param}"
+    if request.param == "parquet":
+        input_data.to_parquet(path, row_group_size=4)
+    else:
+        input_data.reset_index(drop=True).to_feather(path)
+    return path
+
+
+def test_get_required_columns():
+    columns = get_required_columns("ges_krankv_beitr_rente")
+
+    assert sorted(columns) == ["ges_rente_m", "wohnort_ost"]
+
+
+def test_load_only_required_columns(path, input_data, soz_vers_beitr_raw_data):
+    data = load_data(path, targets="pflegev_beitr_m", years=2018, columns=["p_id"])
+
+    expected = input_data[input_data["jahr"] == 2018]
+    assert set(data) == set(get_required_columns("pflegev_beitr_m")) | {"p_id"}
+    assert "sozialv_beitr_m" not in data
+    assert data["p_id"].tolist() == expected["p_id"].tolist()
+
+    params = get_policies_for_date(
+        year=2018, group="soz_vers_beitr", raw_group_data=soz_vers_beitr_raw_data
+    )
+    result = compute_taxes_and_transfers(data, params=params, targets="pflegev_beitr_m")
+    assert result.tolist() == pytest.approx(expected["pflegev_beitr_m"].tolist())
+
+
+def test_iter_data_chunks(path, input_data):
+    chunks = list(iter_data_chunks(path, "rentenv_beitr_m", years=[2018, 2019]))
+
+    data = pd.concat(pd.DataFrame(chunk) for chunk in chunks)
+    expected = input_data[input_data["jahr"].isin([2018, 2019])]
+    assert len(data) == len(expected)
+    assert list(data.index) == list(range(len(expected)))
+
+
+def test_missing_column_raises(input_data, tmp_path):
+    path = tmp_path / "data.parquet"
+    input_data.drop(columns="bruttolohn_m").to_parquet(path)
+
+    with pytest.raises(KeyError, match="bruttolohn_m"):
+        load_data(path, targets="rentenv_beitr_m")
@@ -0,0 +1,153 @@
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from dag_gettsim.dag import compile_dag
+from gettsim.config import ROOT_DIR
+from gettsim.pre_processing.policy_for_date import get_policies_for_date
+
+INPUT_COLS = [
+    "p_id",
+    "hh_id",
+    "tu_id",
+    "bruttolohn_m",
+    "wohnort_ost",
+    "alter",
+    "selbstständig",
+    "hat_kinder",
+    "eink_selbst_m",
+    "ges_rente_m",
+    "prv_krankv",
+    "jahr",
+]
+YEARS = [2002, 2010, 2018, 2019, 2020]
+OUT_COLS = [
+    "sozialv_beitr_m",
+    "rentenv_beitr_m",
+    "arbeitsl_v_beitr_m",
+    "ges_krankv_beitr_m",
+    "pflegev_beitr_m",
+]
+
+
+@pytest.fixture(scope="module")
+def input_data():
+    file_name = "test_dfs_ssc.csv"
+    out = pd.read_csv(ROOT_DIR / "../dag_gettsim/tests" / file_name)
+    return out
+
+
+@pytest.mark.parametrize("year", YEARS)
+@pytest.mark.parametrize("targets", [OUT_COLS, "all"])
+def test_threads_match_serial(input_data, year, targets, soz_vers_beitr_raw_data):
+    year_data = input_data[input_data["jahr"] == year]
+    data = dict(year_data[INPUT_COLS])
+    params = get_policies_for_date(
+        year=year, group="soz_vers_beitr", raw_group_data=soz_vers_beitr_raw_data
+    )
+    plan = compile_dag(targets=targets)
+
+    expected = plan.run(data, params)
+    results = plan.run(data, params, scheduler="threads", n_workers=4)
+
+    assert list(results) == list(expected)
+    for column in expected:
+        pd.testing.assert_series_equal(results[column], expected[column])
+
+
+def test_threads_evaluate_independent_branches_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def left(x):
+        barrier.wait()
+        return x + 1
+
+    def right(x):
+        barrier.wait()
+        return x - 1
+
+    def total(left, right):
+        return left + right
+
+    plan = compile_dag(
+        functions={"left": left, "right": right, "total": total}, targets="total"
+    )
+    result = plan.run({"x": pd.Series([1, 2])}, scheduler="threads", n_workers=2)
+
+    pd.testing.assert_series_equal(result, pd.Series([2, 4], name="total"))
+
+
+def test_threads_raise_missing_variable():
+    plan = compile_dag(targets="pflegev_zusatz_kinderlos")
+
+    with pytest.raises(KeyError, match="hat_kinder"):
+        plan.run({"alter": pd.Series([30])}, scheduler="threads")
+
+
+def test_unknown_scheduler():
+    plan = compile_dag(targets="pflegev_zusatz_kinderlos")
+
+    with pytest.raises(ValueError, match="Unknown scheduler"):
+        plan.run({}, scheduler="gpu")
+
+
+@pytest.mark.parametrize("year", YEARS)
+def test_processes_match_serial(input_data, year, soz_vers_beitr_raw_data):
+    year_data = input_data[input_data["jahr"] == year]
+    data = dict(year_data[INPUT_COLS])
+    params = get_policies_for_date(
+        year=year, group="soz_vers_beitr", raw_group_data=soz_vers_beitr_raw_data
+    )
+    plan = compile_dag(targets=OUT_COLS)
+
+    expected = plan.run(data, params)
+    results = plan.run(data, params, scheduler="processes", n_workers=2)
+
+    assert list(results) == list(expected)
+    for column in expected:
+        pd.testing.assert_series_equal(results[column], expected[column])
+
+
+def _shared_memory_blocks():
+    return {path.name for path in Path("/dev/shm").glob("psm_*")}
+
+
+@pytest.mark.skipif(not Path("/dev/shm").exists(), reason="Requires /dev/shm.")
+def test_processes_free_shared_memory():
+    def double(x):
+        return x * 2
+
+    def failing(double):
+        raise ValueError("Failure in worker.")
+
+    before = _shared_memory_blocks()
+    plan = compile_dag(functions={"double": double}, targets="double")
+    result = plan.run({"x": pd.Series([1, 2])}, scheduler="processes", n_workers=1)
+
+    pd.testing.assert_series_equal(result, pd.Series([2, 4], name="double"))
+    assert _shared_memory_blocks() == before
+
+    plan = compile_dag(
+        functions={"double": double, "failing": failing}, targets="failing"
+    )
+    with pytest.raises(ValueError, match="Failure in worker."):
+        plan.run({"x": pd.Series([1, 2])}, scheduler="processes", n_workers=1)
+    assert _shared_memory_blocks() == before
+
+
+def test_processes_copy_mutated_inputs():
+    def mutating(x):
+        x.iloc[0] = 0
+        return x
+
+    def total(mutating, x):
+        return mutating + x
+
+    plan = compile_dag(
+        functions={"mutating": mutating, "total": total}, targets="total"
+    )
+    result = plan.run({"x": pd.Series([1, 2])}, scheduler="processes", n_workers=1)
+
+    pd.testing.assert_series_equal(result, pd.Series([1, 4], name="total"))
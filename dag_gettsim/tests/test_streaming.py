@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dag_gettsim.dag import compile_dag
+from dag_gettsim.streaming import compute_taxes_and_transfers_in_chunks
+from dag_gettsim.streaming import iter_row_chunks
+from dag_gettsim.streaming import run_in_chunks
+from dag_gettsim.streaming import write_chunks_to_parquet
+from gettsim.config import ROOT_DIR
+from gettsim.pre_processing.policy_for_date import get_policies_for_date
+
+INPUT_COLS = [
+    "p_id",
+    "hh_id",
+    "tu_id",
+    "bruttolohn_m",
+    "wohnort_ost",
+    "alter",
+    "selbstständig",
+    "hat_kinder",
+    "eink_selbst_m",
+    "ges_rente_m",
+    "prv_krankv",
+    "jahr",
+]
+OUT_COLS = [
+    "sozialv_beitr_m",
+    "rentenv_beitr_m",
+    "arbeitsl_v_beitr_m",
+    "ges_krankv_beitr_m",
+    "pflegev_beitr_m",
+]
+
+
+@pytest.fixture(scope="module")
+def year_data():
+    file_name = "test_dfs_ssc.csv"
+    out = pd.read_csv(ROOT_DIR / "../dag_gettsim/tests" / file_name)
+    return out[out["jahr"] == 2018]
+
+
+@pytest.fixture(scope="module")
+def params(soz_vers_beitr_raw_data):
+    return get_policies_for_date(
+        year=2018, group="soz_vers_beitr", raw_group_data=soz_vers_beitr_raw_data
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 4, 100])
+def test_chunked_results_equal_single_run(year_data, params, chunk_size):
+    plan = compile_dag(targets=OUT_COLS)
+    expected = pd.DataFrame(plan.run(dict(year_data[INPUT_COLS]), params))[OUT_COLS]
+
+    chunks = run_in_chunks(plan, year_data[INPUT_COLS], params, chunk_size=chunk_size)
+    results = pd.concat(list(chunks))
+
+    pd.testing.assert_frame_equal(results, expected)
+
+
+def test_iterator_of_array_chunks(year_data, params):
+    columns = {name: year_data[name].to_numpy() for name in INPUT_COLS}
+    chunks = ({name: col[i : i + 3] for name, col in columns.items()} for i in [0, 3])
+
+    results = pd.concat(
+        compute_taxes_and_transfers_in_chunks(
+            chunks, params=params, targets="sozialv_beitr_m", chunk_size=2
+        )
+    )
+
+    expected = year_data["sozialv_beitr_m"].iloc[:6].to_numpy()
+    np.testing.assert_allclose(results["sozialv_beitr_m"].to_numpy(), expected)
+    assert list(results.index) == list(range(6))
+
+
+def test_iter_row_chunks():
+    data = {"a": pd.Series(range(5)), "b": np.arange(5)}
+
+    chunks = list(iter_row_chunks(data, chunk_size=2))
+
+    assert [len(chunk["a"]) for chunk in chunks] == [2, 2, 1]
+    assert chunks[-1]["b"].tolist() == [4]
+
+
+def test_write_chunks_to_parquet(year_data, params, tmp_path):
+    pytest.importorskip("pyarrow")
+    chunks = compute_taxes_and_transfers_in_chunks(
+        year_data[INPUT_COLS], params=params, targets=OUT_COLS, chunk_size=3
+    )
+
+    n_rows = write_chunks_to_parquet(chunks, tmp_path / "results.parquet")
+    results = pd.read_parquet(tmp_path / "results.parquet")
+
+    assert n_rows == len(year_data)
+    pd.testing.assert_frame_equal(
+        results, year_data[OUT_COLS], check_index_type=False, check_dtype=False
+    )